@@ -0,0 +1,60 @@
+"""Generate primary keys server-side (gen_random_uuid / UUIDv7).
+
+Revision ID: 005_uuid_server_defaults
+Revises: 004_full_text_search
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005_uuid_server_defaults"
+down_revision: Union[str, None] = "004_full_text_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RANDOM_UUID_TABLES = ("users", "telegram_sessions", "channels", "user_channels", "scraping_jobs")
+TIME_ORDERED_UUID_TABLES = ("messages", "media")
+
+
+def upgrade() -> None:
+    # UUIDv7: 48-bit unix millisecond timestamp followed by random bits
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+          SELECT encode(
+            set_bit(
+              set_bit(
+                overlay(
+                  uuid_send(gen_random_uuid())
+                  PLACING substring(
+                    int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                    FROM 3
+                  )
+                  FROM 1 FOR 6
+                ),
+                52, 1
+              ),
+              53, 1
+            ),
+            'hex'
+          )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+
+    for table in RANDOM_UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+    for table in TIME_ORDERED_UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuid_generate_v7()")
+
+
+def downgrade() -> None:
+    for table in RANDOM_UUID_TABLES + TIME_ORDERED_UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,50 @@
+"""Add unique constraint on (channel_id, telegram_message_id) for message upserts.
+
+Revision ID: 006_messages_unique_channel_tgid
+Revises: 005_uuid_server_defaults
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006_messages_unique_channel_tgid"
+down_revision: Union[str, None] = "005_uuid_server_defaults"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicates left behind by concurrent scrapes, keeping the oldest row
+    op.execute(
+        """
+        DELETE FROM messages a
+        USING messages b
+        WHERE a.channel_id = b.channel_id
+          AND a.telegram_message_id = b.telegram_message_id
+          AND a.created_at > b.created_at
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM messages a
+        USING messages b
+        WHERE a.channel_id = b.channel_id
+          AND a.telegram_message_id = b.telegram_message_id
+          AND a.created_at = b.created_at
+          AND a.ctid > b.ctid
+        """
+    )
+
+    op.create_unique_constraint(
+        "uq_messages_channel_tgid",
+        "messages",
+        ["channel_id", "telegram_message_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_messages_channel_tgid", "messages", type_="unique")
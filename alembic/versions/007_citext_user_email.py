@@ -0,0 +1,27 @@
+"""Store users.email as case-insensitive citext.
+
+Revision ID: 007_citext_user_email
+Revises: 006_messages_unique_channel_tgid
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "007_citext_user_email"
+down_revision: Union[str, None] = "006_messages_unique_channel_tgid"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    # Fails if two accounts differ only by email case; resolve those first
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE citext")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE varchar(255)")
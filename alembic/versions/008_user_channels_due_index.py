@@ -0,0 +1,35 @@
+"""Add partial covering index for the scheduler's due-schedules query.
+
+Revision ID: 008_user_channels_due_index
+Revises: 007_citext_user_email
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "008_user_channels_due_index"
+down_revision: Union[str, None] = "007_citext_user_email"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_uc_due
+            ON user_channels (next_scheduled_at)
+            INCLUDE (user_id, channel_id)
+            WHERE schedule_enabled AND is_active
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_uc_due")
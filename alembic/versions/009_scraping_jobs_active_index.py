@@ -0,0 +1,34 @@
+"""Add partial index on active scraping jobs per channel.
+
+Revision ID: 009_scraping_jobs_active_index
+Revises: 008_user_channels_due_index
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "009_scraping_jobs_active_index"
+down_revision: Union[str, None] = "008_user_channels_due_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_active
+            ON scraping_jobs (channel_id)
+            WHERE status IN ('pending', 'running')
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_jobs_active")
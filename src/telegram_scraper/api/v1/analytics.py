@@ -4,7 +4,7 @@ from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import Date, and_, cast, func, select
+from sqlalchemy import Date, and_, cast, exists, func, select
 
 from telegram_scraper.api.deps import CurrentUser, DbSession
 from telegram_scraper.models.channel import Channel
@@ -90,15 +90,17 @@ async def get_messages_over_time(
     # Get user's channel IDs
     if channel_id:
         # Verify user owns this channel
-        result = await db.execute(
-            select(UserChannel).where(
-                and_(
-                    UserChannel.user_id == current_user.id,
-                    UserChannel.channel_id == channel_id,
+        has_access = await db.scalar(
+            select(
+                exists().where(
+                    and_(
+                        UserChannel.user_id == current_user.id,
+                        UserChannel.channel_id == channel_id,
+                    )
                 )
             )
         )
-        if not result.scalar_one_or_none():
+        if not has_access:
             raise HTTPException(status_code=404, detail="Channel not found")
         channel_ids = [channel_id]
     else:
@@ -143,15 +145,17 @@ async def get_top_senders(
     """Get top message senders."""
     # Get user's channel IDs
     if channel_id:
-        result = await db.execute(
-            select(UserChannel).where(
-                and_(
-                    UserChannel.user_id == current_user.id,
-                    UserChannel.channel_id == channel_id,
+        has_access = await db.scalar(
+            select(
+                exists().where(
+                    and_(
+                        UserChannel.user_id == current_user.id,
+                        UserChannel.channel_id == channel_id,
+                    )
                 )
             )
         )
-        if not result.scalar_one_or_none():
+        if not has_access:
             raise HTTPException(status_code=404, detail="Channel not found")
         channel_ids = [channel_id]
     else:
@@ -216,15 +220,17 @@ async def get_media_breakdown(
     """Get media type breakdown."""
     # Get user's channel IDs
     if channel_id:
-        result = await db.execute(
-            select(UserChannel).where(
-                and_(
-                    UserChannel.user_id == current_user.id,
-                    UserChannel.channel_id == channel_id,
+        has_access = await db.scalar(
+            select(
+                exists().where(
+                    and_(
+                        UserChannel.user_id == current_user.id,
+                        UserChannel.channel_id == channel_id,
+                    )
                 )
             )
         )
-        if not result.scalar_one_or_none():
+        if not has_access:
             raise HTTPException(status_code=404, detail="Channel not found")
         channel_ids = [channel_id]
     else:
@@ -267,15 +273,17 @@ async def get_activity_heatmap(
     """Get message activity by hour of day and day of week."""
     # Get user's channel IDs
     if channel_id:
-        result = await db.execute(
-            select(UserChannel).where(
-                and_(
-                    UserChannel.user_id == current_user.id,
-                    UserChannel.channel_id == channel_id,
+        has_access = await db.scalar(
+            select(
+                exists().where(
+                    and_(
+                        UserChannel.user_id == current_user.id,
+                        UserChannel.channel_id == channel_id,
+                    )
                 )
             )
         )
-        if not result.scalar_one_or_none():
+        if not has_access:
             raise HTTPException(status_code=404, detail="Channel not found")
         channel_ids = [channel_id]
     else:
@@ -8,6 +8,7 @@ from telegram_scraper.core.security import (
     create_access_token,
     create_refresh_token,
     get_password_hash,
+    password_needs_rehash,
     verify_password,
     verify_token,
 )
@@ -38,7 +39,6 @@ async def register(user_data: UserCreate, db: DbSession) -> User:
     )
     db.add(user)
     await db.commit()
-    await db.refresh(user)
 
     return user
 
@@ -62,6 +62,11 @@ async def login(login_data: LoginRequest, db: DbSession) -> Token:
             detail="User account is disabled",
         )
 
+    # Transparently upgrade legacy bcrypt hashes to Argon2id
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = get_password_hash(login_data.password)
+        await db.commit()
+
     access_token = create_access_token(data={"sub": str(user.id)})
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
 
@@ -1,6 +1,6 @@
 """Channel management endpoints."""
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
@@ -126,9 +126,11 @@ async def get_channel_messages(
     media_type: str = Query(
         None, description="Filter by media type (photo, video, document, audio)"
     ),
-    date_from: str = Query(None, description="Filter from date (YYYY-MM-DD)"),
-    date_to: str = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    date_from: date = Query(None, description="Filter from date (YYYY-MM-DD)"),
+    date_to: date = Query(None, description="Filter to date (YYYY-MM-DD)"),
     sender_id: int = Query(None, description="Filter by sender ID"),
+    after_date: datetime = Query(None, description="Keyset cursor: date of the last row seen"),
+    after_id: UUID = Query(None, description="Keyset cursor: id of the last row seen"),
 ) -> dict:
     """Get messages for a channel with advanced filters."""
     offset = (page - 1) * limit
@@ -143,6 +145,8 @@ async def get_channel_messages(
         date_from=date_from,
         date_to=date_to,
         sender_id=sender_id,
+        after_date=after_date,
+        after_id=after_id,
     )
 
 
@@ -210,7 +214,6 @@ async def update_channel_schedule(
         user_channel.next_scheduled_at = None
 
     await db.commit()
-    await db.refresh(user_channel)
 
     return ScheduleResponse(
         enabled=user_channel.schedule_enabled,
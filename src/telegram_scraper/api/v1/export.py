@@ -7,7 +7,8 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select
+from sqlalchemy import exists, select
+from sqlalchemy.orm import undefer
 
 from telegram_scraper.api.deps import CurrentUser, DbSession
 from telegram_scraper.models.channel import Channel
@@ -26,14 +27,16 @@ async def export_channel_csv(
 ) -> StreamingResponse:
     """Export channel messages as CSV."""
     # Verify access
-    result = await db.execute(
-        select(UserChannel).where(
-            UserChannel.channel_id == channel_id,
-            UserChannel.user_id == current_user.id,
-            UserChannel.is_active,
+    has_access = await db.scalar(
+        select(
+            exists().where(
+                UserChannel.channel_id == channel_id,
+                UserChannel.user_id == current_user.id,
+                UserChannel.is_active,
+            )
         )
     )
-    if not result.scalar_one_or_none():
+    if not has_access:
         raise HTTPException(status_code=404, detail="Channel not found")
 
     # Get channel info
@@ -105,14 +108,16 @@ async def export_channel_json(
 ) -> StreamingResponse:
     """Export channel messages as JSON."""
     # Verify access
-    result = await db.execute(
-        select(UserChannel).where(
-            UserChannel.channel_id == channel_id,
-            UserChannel.user_id == current_user.id,
-            UserChannel.is_active,
+    has_access = await db.scalar(
+        select(
+            exists().where(
+                UserChannel.channel_id == channel_id,
+                UserChannel.user_id == current_user.id,
+                UserChannel.is_active,
+            )
         )
     )
-    if not result.scalar_one_or_none():
+    if not has_access:
         raise HTTPException(status_code=404, detail="Channel not found")
 
     # Get channel info
@@ -120,7 +125,12 @@ async def export_channel_json(
     channel = result.scalar_one_or_none()
 
     # Get messages
-    query = select(Message).where(Message.channel_id == channel_id).order_by(Message.date.desc())
+    query = (
+        select(Message)
+        .options(undefer(Message.reactions))
+        .where(Message.channel_id == channel_id)
+        .order_by(Message.date.desc())
+    )
     if limit:
         query = query.limit(limit)
 
@@ -1,5 +1,6 @@
 """Job management endpoints."""
 
+from datetime import datetime
 from uuid import UUID
 
 from arq import create_pool
@@ -35,6 +36,10 @@ async def list_jobs(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
     status: str | None = Query(None),
+    after_created_at: datetime | None = Query(
+        None, description="Keyset cursor: created_at of the last job seen"
+    ),
+    after_id: UUID | None = Query(None, description="Keyset cursor: id of the last job seen"),
 ) -> dict:
     """List jobs for the current user."""
     offset = (page - 1) * limit
@@ -44,6 +49,8 @@ async def list_jobs(
         limit=limit,
         offset=offset,
         status_filter=status,
+        after_created_at=after_created_at,
+        after_id=after_id,
     )
 
 
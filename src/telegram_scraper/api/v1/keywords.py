@@ -6,7 +6,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func, select, update
+from sqlalchemy import exists, func, select, update
 
 from telegram_scraper.api.deps import CurrentUser, DbSession
 from telegram_scraper.models.channel import Channel
@@ -135,25 +135,29 @@ async def create_keyword_alert(
 
     # Validate channel if provided
     if request.channel_id:
-        result = await db.execute(
-            select(UserChannel).where(
-                UserChannel.channel_id == request.channel_id,
-                UserChannel.user_id == current_user.id,
-                UserChannel.is_active,
+        has_access = await db.scalar(
+            select(
+                exists().where(
+                    UserChannel.channel_id == request.channel_id,
+                    UserChannel.user_id == current_user.id,
+                    UserChannel.is_active,
+                )
             )
         )
-        if not result.scalar_one_or_none():
+        if not has_access:
             raise HTTPException(status_code=404, detail="Channel not found")
 
     # Check for duplicate
-    result = await db.execute(
-        select(KeywordAlert).where(
-            KeywordAlert.user_id == current_user.id,
-            KeywordAlert.keyword == request.keyword,
-            KeywordAlert.channel_id == request.channel_id,
+    duplicate = await db.scalar(
+        select(
+            exists().where(
+                KeywordAlert.user_id == current_user.id,
+                KeywordAlert.keyword == request.keyword,
+                KeywordAlert.channel_id == request.channel_id,
+            )
         )
     )
-    if result.scalar_one_or_none():
+    if duplicate:
         raise HTTPException(status_code=400, detail="Keyword alert already exists")
 
     alert = KeywordAlert(
@@ -166,7 +170,6 @@ async def create_keyword_alert(
     )
     db.add(alert)
     await db.commit()
-    await db.refresh(alert)
 
     return {
         "id": alert.id,
@@ -257,7 +260,6 @@ async def update_keyword_alert(
 
     alert.updated_at = datetime.now(UTC)
     await db.commit()
-    await db.refresh(alert)
 
     return {
         "id": alert.id,
@@ -382,13 +384,15 @@ async def mark_matches_read(
 ) -> dict:
     """Mark keyword matches as read."""
     # Verify ownership
-    result = await db.execute(
-        select(KeywordAlert).where(
-            KeywordAlert.id == alert_id,
-            KeywordAlert.user_id == current_user.id,
+    alert_exists = await db.scalar(
+        select(
+            exists().where(
+                KeywordAlert.id == alert_id,
+                KeywordAlert.user_id == current_user.id,
+            )
         )
     )
-    if not result.scalar_one_or_none():
+    if not alert_exists:
         raise HTTPException(status_code=404, detail="Keyword alert not found")
 
     # Mark as read
@@ -8,7 +8,7 @@ from arq.connections import RedisSettings
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, select
 
 from telegram_scraper.api.deps import CurrentUser, DbSession
 from telegram_scraper.config import settings
@@ -245,14 +245,16 @@ async def start_batch_download(
 ) -> dict:
     """Start downloading a batch of pending media for a channel."""
     # Verify user owns this channel
-    result = await db.execute(
-        select(UserChannel).where(
-            UserChannel.channel_id == request.channel_id,
-            UserChannel.user_id == current_user.id,
-            UserChannel.is_active,
+    has_access = await db.scalar(
+        select(
+            exists().where(
+                UserChannel.channel_id == request.channel_id,
+                UserChannel.user_id == current_user.id,
+                UserChannel.is_active,
+            )
         )
     )
-    if not result.scalar_one_or_none():
+    if not has_access:
         raise HTTPException(status_code=404, detail="Channel not found")
 
     # Verify session belongs to user
@@ -304,14 +306,16 @@ async def get_channel_media_stats(
 ) -> dict:
     """Get media download stats for a channel."""
     # Verify user owns this channel
-    result = await db.execute(
-        select(UserChannel).where(
-            UserChannel.channel_id == channel_id,
-            UserChannel.user_id == current_user.id,
-            UserChannel.is_active,
+    has_access = await db.scalar(
+        select(
+            exists().where(
+                UserChannel.channel_id == channel_id,
+                UserChannel.user_id == current_user.id,
+                UserChannel.is_active,
+            )
         )
     )
-    if not result.scalar_one_or_none():
+    if not has_access:
         raise HTTPException(status_code=404, detail="Channel not found")
 
     # Get stats by status
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 
 from telegram_scraper.api.deps import CurrentUser, DbSession
 from telegram_scraper.schemas.telegram_session import (
@@ -13,7 +13,7 @@ from telegram_scraper.schemas.telegram_session import (
     Verify2FARequest,
     VerifyCodeRequest,
 )
-from telegram_scraper.services.telegram_service import TelegramService
+from telegram_scraper.services.telegram_service import QRImageFormat, TelegramService
 
 router = APIRouter(prefix="/telegram", tags=["telegram"])
 
@@ -138,6 +138,7 @@ async def start_qr_login(
     session_id: UUID,
     db: DbSession,
     current_user: CurrentUser,
+    image_format: QRImageFormat = Query("svg", description="QR image format (svg or png)"),
 ) -> dict:
     """Start QR code login process."""
     try:
@@ -145,6 +146,7 @@ async def start_qr_login(
             db=db,
             session_id=session_id,
             user_id=current_user.id,
+            image_format=image_format,
         )
         return result
     except ValueError as e:
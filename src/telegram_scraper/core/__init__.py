@@ -11,6 +11,7 @@ from telegram_scraper.core.security import (
     create_access_token,
     create_refresh_token,
     get_password_hash,
+    password_needs_rehash,
     verify_password,
     verify_token,
 )
@@ -25,5 +26,6 @@ __all__ = [
     "create_refresh_token",
     "verify_password",
     "get_password_hash",
+    "password_needs_rehash",
     "verify_token",
 ]
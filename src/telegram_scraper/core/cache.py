@@ -0,0 +1,98 @@
+"""Redis client and short-lived response caching for API read endpoints."""
+
+import functools
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import orjson
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from telegram_scraper.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_redis: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Get the shared Redis client for the API process."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.redis_url)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def _version_key(namespace: str, user_id: Any) -> str:
+    return f"cache_ver:{namespace}:{user_id}"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError
+
+
+async def invalidate(namespace: str, user_id: Any) -> None:
+    """Invalidate every cached entry of a namespace for a user by bumping its version."""
+    try:
+        await get_redis().incr(_version_key(namespace, user_id))
+    except (RedisError, OSError) as e:
+        logger.warning(f"Cache invalidation failed for {namespace}:{user_id}: {e}")
+
+
+def cached(namespace: str, ttl: int) -> Callable[[Callable[..., Awaitable[T]]], Callable]:
+    """
+    Cache a per-user async read in Redis for `ttl` seconds.
+
+    The wrapped function must take `user_id`; its other arguments (except `cls` and
+    `db`) become part of the key together with the user's namespace version, so
+    `invalidate()` drops all of a user's entries at once. Redis errors fail open.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k not in ("cls", "db")}
+            user_id = params["user_id"]
+
+            redis = get_redis()
+            try:
+                version = await redis.get(_version_key(namespace, user_id)) or b"0"
+                key = f"cache:{namespace}:{user_id}:{version.decode()}:" + ":".join(
+                    f"{k}={v}" for k, v in sorted(params.items()) if k != "user_id"
+                )
+                hit = await redis.get(key)
+                if hit is not None:
+                    return orjson.loads(hit)
+            except (RedisError, OSError) as e:
+                logger.warning(f"Cache lookup failed for {namespace}: {e}")
+                return await func(*args, **kwargs)
+
+            value = await func(*args, **kwargs)
+            try:
+                await redis.set(key, orjson.dumps(value, default=_default), ex=ttl)
+            except (RedisError, OSError) as e:
+                logger.warning(f"Cache store failed for {namespace}: {e}")
+            return value
+
+        return wrapper
+
+    return decorator
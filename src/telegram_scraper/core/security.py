@@ -1,27 +1,58 @@
 """Security utilities for authentication."""
 
+import hashlib
+import hmac
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from jose import JWTError, jwt
 
 from telegram_scraper.config import settings
 
+# Argon2id, OWASP minimum profile (19 MiB, 2 iterations, 1 lane)
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Recently verified passwords: hash -> sha256(password). Absorbs repeated logins
+# from the same client without re-running the (deliberately slow) KDF.
+_verified_cache: TTLCache[str, bytes] = TTLCache(maxsize=10_000, ttl=30)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
+    """Verify a password against its hash (Argon2id, or legacy bcrypt)."""
     password_bytes = plain_password.encode("utf-8")
-    hashed_bytes = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    digest = hashlib.sha256(password_bytes).digest()
+
+    cached = _verified_cache.get(hashed_password)
+    if cached is not None and hmac.compare_digest(cached, digest):
+        return True
+
+    if hashed_password.startswith("$argon2"):
+        try:
+            verified = _password_hasher.verify(hashed_password, password_bytes)
+        except (VerificationError, InvalidHashError):
+            verified = False
+    else:
+        verified = bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
+
+    if verified:
+        _verified_cache[hashed_password] = digest
+    return verified
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash is legacy bcrypt or uses outdated Argon2 parameters."""
+    if not hashed_password.startswith("$argon2"):
+        return True
+    return _password_hasher.check_needs_rehash(hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode("utf-8")
+    """Hash a password using Argon2id (stored as a `$argon2id$...` string)."""
+    return _password_hasher.hash(password.encode("utf-8"))
 
 
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
@@ -1,17 +1,46 @@
 """Database session management."""
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload
 
 from telegram_scraper.config import settings
 
+
+def json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(value).decode()
+
+
+def _raise_on_lazy_load(state: ORMExecuteState) -> None:
+    """Add raiseload("*") to top-level ORM selects; explicit loader options still apply."""
+    if state.is_select and not state.is_column_load and not state.is_relationship_load:
+        state.statement = state.statement.options(raiseload("*"))
+
+
+if settings.db_raise_on_lazy_load:
+    # Applies to every Session, including the ones worker tasks create
+    event.listen(Session, "do_orm_execute", _raise_on_lazy_load)
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    connect_args={
+        "server_settings": {"tcp_keepalives_idle": "30"},
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    },
 )
 
 async_session_maker = async_sessionmaker(
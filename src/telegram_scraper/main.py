@@ -9,6 +9,7 @@ from fastapi.responses import JSONResponse
 
 from telegram_scraper.api.v1.router import api_router
 from telegram_scraper.config import settings
+from telegram_scraper.core.cache import close_redis
 from telegram_scraper.core.exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -25,6 +26,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     yield
     # Shutdown
+    await close_redis()
     await engine.dispose()
 
 
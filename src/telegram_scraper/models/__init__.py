@@ -1,4 +1,10 @@
-"""SQLAlchemy ORM models."""
+"""SQLAlchemy ORM models.
+
+The models are used with the async engine in telegram_scraper.db.session. Concurrent
+scraping jobs each hold a connection for their whole run, so that engine is sized via
+DB_POOL_SIZE / DB_MAX_OVERFLOW and recycles connections (DB_POOL_RECYCLE) with
+pre-ping and TCP keepalives to avoid stale asyncpg connections mid-scrape.
+"""
 
 from telegram_scraper.models.base import Base
 from telegram_scraper.models.channel import Channel
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -31,10 +31,20 @@ class TimestampMixin:
 
 
 class UUIDMixin:
-    """Mixin that adds a UUID primary key."""
+    """Mixin that adds a UUID primary key generated by PostgreSQL."""
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
+    )
+
+
+class TimeOrderedUUIDMixin:
+    """Mixin that adds a time-ordered UUIDv7 primary key for append-heavy tables."""
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("uuid_generate_v7()"),
     )
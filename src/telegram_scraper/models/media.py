@@ -8,14 +8,14 @@ from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String,
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from telegram_scraper.models.base import Base, UUIDMixin
+from telegram_scraper.models.base import Base, TimeOrderedUUIDMixin
 
 if TYPE_CHECKING:
     from telegram_scraper.models.channel import Channel
     from telegram_scraper.models.message import Message
 
 
-class Media(Base, UUIDMixin):
+class Media(Base, TimeOrderedUUIDMixin):
     """Media file associated with a message."""
 
     __tablename__ = "media"
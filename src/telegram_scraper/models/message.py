@@ -1,21 +1,80 @@
 """Message model for scraped Telegram messages."""
 
 import uuid
+from collections.abc import Callable, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID, TSVECTOR
+import orjson
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Row,
+    String,
+    Text,
+    TypeDecorator,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID, insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from telegram_scraper.models.base import Base, UUIDMixin
+from telegram_scraper.models.base import Base, TimeOrderedUUIDMixin
 
 if TYPE_CHECKING:
     from telegram_scraper.models.channel import Channel
     from telegram_scraper.models.media import Media
 
+# Batches at least this large are loaded with COPY instead of a multi-row INSERT
+COPY_THRESHOLD = 1000
 
-class Message(Base, UUIDMixin):
+# Columns written by the scraper's bulk ingest path
+BULK_COLUMNS = (
+    "channel_id",
+    "telegram_message_id",
+    "date",
+    "sender_id",
+    "first_name",
+    "last_name",
+    "username",
+    "message_text",
+    "media_type",
+    "reply_to_message_id",
+    "post_author",
+    "views",
+    "forwards",
+    "reactions",
+)
+
+
+class PreEncodedJSONB(TypeDecorator[Any]):
+    """
+    JSONB that also accepts JSON the caller already serialized.
+
+    `str` values are sent as-is so bulk writers can encode once with orjson; any
+    other value goes through the engine's JSON serializer as usual.
+    """
+
+    impl = JSONB
+    cache_ok = True
+
+    def bind_processor(self, dialect: Dialect) -> Callable[[Any], Any] | None:
+        serialize = self.impl_instance.bind_processor(dialect)
+        if serialize is None:
+            return None
+
+        def process(value: Any) -> Any:
+            return value if isinstance(value, str) else serialize(value)
+
+        return process
+
+
+class Message(Base, TimeOrderedUUIDMixin):
     """Scraped Telegram message."""
 
     __tablename__ = "messages"
@@ -23,9 +82,12 @@ class Message(Base, UUIDMixin):
         Index("idx_messages_channel_date", "channel_id", "date"),
         Index("idx_messages_telegram_id", "telegram_message_id"),
         Index("idx_messages_sender", "sender_id"),
+        UniqueConstraint("channel_id", "telegram_message_id", name="uq_messages_channel_tgid"),
         {"postgresql_partition_by": None},  # Can be partitioned by date in future
     )
 
+    # as_uuid=True is the fast path on asyncpg: uuid.UUID values are sent as 16 raw
+    # bytes with no SQLAlchemy processors; as_uuid=False adds a str conversion per row
     channel_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("channels.id", ondelete="CASCADE"),
@@ -44,7 +106,10 @@ class Message(Base, UUIDMixin):
     post_author: Mapped[str | None] = mapped_column(String(255), nullable=True)
     views: Mapped[int | None] = mapped_column(Integer, nullable=True)
     forwards: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    reactions: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    # Deferred: only loaded when a query asks for it with undefer()
+    reactions: Mapped[dict[str, Any] | None] = mapped_column(
+        PreEncodedJSONB, nullable=True, deferred=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default="now()",
@@ -63,3 +128,65 @@ class Message(Base, UUIDMixin):
 
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, telegram_id={self.telegram_message_id})>"
+
+    @classmethod
+    async def bulk_upsert(cls, db: AsyncSession, rows: list[dict[str, Any]]) -> Sequence[Row]:
+        """
+        Insert a batch of messages, skipping ones that already exist.
+
+        Returns (id, telegram_message_id) for the rows that were actually inserted.
+        The caller is responsible for committing.
+        """
+        if not rows:
+            return []
+
+        if len(rows) >= COPY_THRESHOLD:
+            return await cls._copy_upsert(db, rows)
+
+        stmt = (
+            insert(cls)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["channel_id", "telegram_message_id"])
+            .returning(cls.id, cls.telegram_message_id)
+        )
+        result = await db.execute(stmt)
+        return result.all()
+
+    @classmethod
+    async def _copy_upsert(cls, db: AsyncSession, rows: list[dict[str, Any]]) -> Sequence[Row]:
+        """COPY rows into a temporary staging table, then merge into messages."""
+        columns = ", ".join(BULK_COLUMNS)
+        await db.execute(
+            text(
+                f"CREATE TEMP TABLE messages_staging ON COMMIT DROP AS "
+                f"SELECT {columns} FROM messages WITH NO DATA"
+            )
+        )
+
+        # The asyncpg JSONB codec expects serialized JSON; pre-encoded text passes through
+        records = [
+            tuple(
+                orjson.dumps(row[col]).decode()
+                if col == "reactions" and row.get(col) is not None and not isinstance(row[col], str)
+                else row.get(col)
+                for col in BULK_COLUMNS
+            )
+            for row in rows
+        ]
+        conn = await db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "messages_staging", records=records, columns=BULK_COLUMNS
+        )
+
+        result = await db.execute(
+            text(
+                f"INSERT INTO messages ({columns}) "
+                f"SELECT {columns} FROM messages_staging "
+                f"ON CONFLICT (channel_id, telegram_message_id) DO NOTHING "
+                f"RETURNING id, telegram_message_id"
+            )
+        )
+        inserted = result.all()
+        await db.execute(text("DROP TABLE messages_staging"))
+        return inserted
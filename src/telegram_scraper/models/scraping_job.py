@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,6 +22,12 @@ class ScrapingJob(Base, UUIDMixin, TimestampMixin):
     __table_args__ = (
         Index("idx_jobs_status", "status"),
         Index("idx_jobs_user", "user_id"),
+        # Active-job checks only touch pending/running rows, a small hot set
+        Index(
+            "idx_jobs_active",
+            "channel_id",
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -59,7 +65,7 @@ class ScrapingJob(Base, UUIDMixin, TimestampMixin):
         DateTime(timezone=True),
         nullable=True,
     )
-    job_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    job_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True, deferred=True)
     arq_job_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Relationships
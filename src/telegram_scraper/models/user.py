@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Boolean, String
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from telegram_scraper.models.base import Base, TimestampMixin, UUIDMixin
@@ -19,7 +20,9 @@ class User(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "users"
 
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    # Case-insensitive, so the unique index serves login lookups without lower()
+    email: Mapped[str] = mapped_column(CITEXT, unique=True, nullable=False, index=True)
+    # Argon2id ("$argon2id$...") or legacy bcrypt ("$2b$..."), upgraded on login
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
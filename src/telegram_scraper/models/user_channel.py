@@ -9,9 +9,11 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -27,7 +29,16 @@ class UserChannel(Base, UUIDMixin):
     """Association between users and channels they track."""
 
     __tablename__ = "user_channels"
-    __table_args__ = (UniqueConstraint("user_id", "channel_id", name="uq_user_channel"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "channel_id", name="uq_user_channel"),
+        # Serves the scheduler's due-schedules poll with an index-only scan
+        Index(
+            "idx_uc_due",
+            "next_scheduled_at",
+            postgresql_where=text("schedule_enabled AND is_active"),
+            postgresql_include=["user_id", "channel_id"],
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -2,13 +2,15 @@
 
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+
+from telegram_scraper.schemas.user import Email
 
 
 class LoginRequest(BaseModel):
     """Schema for login request."""
 
-    email: EmailStr
+    email: Email
     password: str
 
 
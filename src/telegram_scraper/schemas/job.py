@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class JobType(str, Enum):
@@ -58,7 +58,11 @@ class JobResponse(BaseModel):
     created_at: datetime
     job_metadata: dict[str, Any] | None
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "extra": "ignore", "defer_build": False}
+
+
+# Built once at import; validates a whole page of ORM rows in a single call
+JOB_LIST_ADAPTER = TypeAdapter(list[JobResponse])
 
 
 class JobListResponse(BaseModel):
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class MessageResponse(BaseModel):
@@ -25,7 +25,11 @@ class MessageResponse(BaseModel):
     forwards: int | None
     reactions: dict[str, Any] | None
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "extra": "ignore", "defer_build": False}
+
+
+# Built once at import; validates a whole page of ORM rows in a single call
+MESSAGE_LIST_ADAPTER = TypeAdapter(list[MessageResponse])
 
 
 class MessageSearchParams(BaseModel):
@@ -1,22 +1,47 @@
 """User schemas for API."""
 
+import re
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, Field
+
+# Strict ASCII address: dot-atom local part, dotted domain with an alphabetic TLD
+EMAIL_RE = re.compile(
+    r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}"
+)
+
+
+def _validate_email(value: str) -> str:
+    """Validate an email address syntactically and normalize its domain to lowercase.
+
+    No DNS or deliverability checks are made at request time.
+    """
+    value = value.strip()
+    if len(value) > 254 or not EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    if len(local) > 64:
+        raise ValueError("value is not a valid email address")
+    return f"{local}@{domain.lower()}"
+
+
+Email = Annotated[str, AfterValidator(_validate_email)]
 
 
 class UserCreate(BaseModel):
     """Schema for creating a new user."""
 
-    email: EmailStr
+    email: Email
     password: str = Field(min_length=8, max_length=100)
 
 
 class UserUpdate(BaseModel):
     """Schema for updating a user."""
 
-    email: EmailStr | None = None
+    email: Email | None = None
     password: str | None = Field(default=None, min_length=8, max_length=100)
     is_active: bool | None = None
 
@@ -1,18 +1,154 @@
 """Channel service for managing tracked channels."""
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, time
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    DateTime,
+    Integer,
+    Select,
+    String,
+    Text,
+    and_,
+    bindparam,
+    exists,
+    func,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from telegram_scraper.core.cache import cached, invalidate
 from telegram_scraper.models.channel import Channel
 from telegram_scraper.models.media import Media
 from telegram_scraper.models.message import Message
 from telegram_scraper.models.user_channel import UserChannel
+from telegram_scraper.schemas.message import MESSAGE_LIST_ADAPTER
 from telegram_scraper.services.telegram_service import TelegramService
 
+# Per-channel stats, correlated to Channel so listings fetch them in the same query
+_message_count = (
+    select(func.count(Message.id))
+    .where(Message.channel_id == Channel.id)
+    .correlate(Channel)
+    .scalar_subquery()
+    .label("message_count")
+)
+_media_count = (
+    select(func.count(Media.id))
+    .where(Media.channel_id == Channel.id)
+    .correlate(Channel)
+    .scalar_subquery()
+    .label("media_count")
+)
+
+# Plain columns for channel listings; rows map straight to response dicts
+_channel_columns = (
+    Channel.id,
+    Channel.telegram_id,
+    Channel.username,
+    Channel.title,
+    Channel.channel_type,
+    _message_count,
+    _media_count,
+    UserChannel.last_scraped_message_id,
+    UserChannel.scrape_media,
+    UserChannel.added_at,
+)
+
+# Optional message filters: each one is a bound parameter plus the predicate it
+# enables. Statements are specialized per combination of filters present, so the
+# planner sees only real predicates (no `:p IS NULL OR ...` branches that defeat
+# index use in generic prepared plans) and each shape is built and compiled once.
+_search = bindparam("search", type_=Text)
+_media_type = bindparam("media_type", type_=String)
+_date_from = bindparam("date_from", type_=DateTime(timezone=True))
+_date_to = bindparam("date_to", type_=DateTime(timezone=True))
+_sender_id = bindparam("sender_id", type_=BigInteger)
+_OPTIONAL_FILTERS = (
+    # Full-text search using indexed tsvector column (web-style syntax)
+    ("search", Message.search_vector.op("@@")(func.websearch_to_tsquery("simple", _search))),
+    ("media_type", Message.media_type == _media_type),
+    ("date_from", Message.date >= _date_from),
+    ("date_to", Message.date <= _date_to),
+    ("sender_id", Message.sender_id == _sender_id),
+)
+_FilterKey = tuple[bool, ...]
+
+
+@lru_cache(maxsize=32)
+def _message_filter(key: _FilterKey) -> ColumnElement[bool]:
+    """Filter for one combination of present optional filters."""
+    return and_(
+        Message.channel_id == bindparam("channel_id", type_=PG_UUID(as_uuid=True)),
+        *(clause for (_, clause), present in zip(_OPTIONAL_FILTERS, key) if present),
+    )
+
+
+# Columns for message list views; text is truncated server-side to keep pages small
+MESSAGE_PREVIEW_LENGTH = 500
+_message_columns = (
+    Message.id,
+    Message.telegram_message_id,
+    Message.date,
+    Message.sender_id,
+    Message.first_name,
+    Message.last_name,
+    Message.username,
+    func.substring(Message.message_text, 1, MESSAGE_PREVIEW_LENGTH).label("message_text"),
+    Message.media_type,
+    Message.reply_to_message_id,
+    Message.post_author,
+    Message.views,
+    Message.forwards,
+    Message.reactions,
+)
+
+
+@lru_cache(maxsize=32)
+def _messages_page_stmt(key: _FilterKey) -> Select:
+    """OFFSET page plus the total match count as a window column."""
+    return (
+        select(*_message_columns, func.count().over().label("total"))
+        .where(_message_filter(key))
+        .order_by(Message.date.desc(), Message.id.desc())
+        .limit(bindparam("limit", type_=Integer))
+        .offset(bindparam("offset", type_=Integer))
+    )
+
+
+@lru_cache(maxsize=32)
+def _messages_count_stmt(key: _FilterKey) -> Select:
+    return select(func.count(Message.id)).where(_message_filter(key))
+
+
+@lru_cache(maxsize=32)
+def _messages_after_stmt(key: _FilterKey) -> Select:
+    """
+    Keyset page: seeks past the (date, id) of the previous page's last row instead
+    of scanning and discarding OFFSET rows, so deep pages cost the same as the first.
+    """
+    return (
+        select(*_message_columns)
+        .where(
+            _message_filter(key),
+            tuple_(Message.date, Message.id)
+            < tuple_(
+                bindparam("after_date", type_=DateTime(timezone=True)),
+                bindparam("after_id", type_=PG_UUID(as_uuid=True)),
+            ),
+        )
+        .order_by(Message.date.desc(), Message.id.desc())
+        .limit(bindparam("limit", type_=Integer))
+    )
+
 
 class ChannelService:
     """Service for managing channels."""
@@ -46,76 +182,44 @@ class ChannelService:
                 except Exception:
                     pass
 
-            channel = Channel(
+            # A concurrent request may insert the same channel first; the no-op
+            # update makes RETURNING yield that row instead of raising
+            stmt = insert(Channel).values(
                 telegram_id=telegram_id,
                 username=username,
                 title=title or f"Channel {telegram_id}",
                 channel_type=channel_type,
             )
-            db.add(channel)
-            await db.flush()
-
-        # Check if user already tracks this channel
-        result = await db.execute(
-            select(UserChannel).where(
-                UserChannel.user_id == user_id,
-                UserChannel.channel_id == channel.id,
+            channel = await db.scalar(
+                stmt.on_conflict_do_update(
+                    index_elements=[Channel.telegram_id],
+                    set_={"telegram_id": stmt.excluded.telegram_id},
+                ).returning(Channel)
             )
-        )
-        user_channel = result.scalar_one_or_none()
 
-        if not user_channel:
-            user_channel = UserChannel(
-                user_id=user_id,
-                channel_id=channel.id,
-                is_active=True,
-            )
-            db.add(user_channel)
+        # Track the channel for the user unless they already do
+        await db.execute(
+            insert(UserChannel)
+            .values(user_id=user_id, channel_id=channel.id, is_active=True)
+            .on_conflict_do_nothing(constraint="uq_user_channel")
+        )
 
+        # The session doesn't expire on commit, and the server-generated id came
+        # back through RETURNING, so the instance is returned without a refresh
         await db.commit()
-        await db.refresh(channel)
+        await invalidate("channels", user_id)
         return channel
 
     @classmethod
+    @cached("channels", ttl=10)
     async def get_channels(cls, db: AsyncSession, user_id: uuid.UUID) -> list[dict[str, Any]]:
         """Get all channels tracked by a user with stats."""
         result = await db.execute(
-            select(Channel, UserChannel)
+            select(*_channel_columns)
             .join(UserChannel, UserChannel.channel_id == Channel.id)
             .where(UserChannel.user_id == user_id, UserChannel.is_active)
         )
-        rows = result.all()
-
-        channels = []
-        for channel, user_channel in rows:
-            # Get message count
-            msg_count_result = await db.execute(
-                select(func.count(Message.id)).where(Message.channel_id == channel.id)
-            )
-            message_count = msg_count_result.scalar() or 0
-
-            # Get media count
-            media_count_result = await db.execute(
-                select(func.count(Media.id)).where(Media.channel_id == channel.id)
-            )
-            media_count = media_count_result.scalar() or 0
-
-            channels.append(
-                {
-                    "id": channel.id,
-                    "telegram_id": channel.telegram_id,
-                    "username": channel.username,
-                    "title": channel.title,
-                    "channel_type": channel.channel_type,
-                    "message_count": message_count,
-                    "media_count": media_count,
-                    "last_scraped_message_id": user_channel.last_scraped_message_id,
-                    "scrape_media": user_channel.scrape_media,
-                    "added_at": user_channel.added_at,
-                }
-            )
-
-        return channels
+        return [dict(row) for row in result.mappings()]
 
     @classmethod
     async def get_channel(
@@ -123,7 +227,7 @@ class ChannelService:
     ) -> dict[str, Any] | None:
         """Get a specific channel with stats."""
         result = await db.execute(
-            select(Channel, UserChannel)
+            select(*_channel_columns)
             .join(UserChannel, UserChannel.channel_id == Channel.id)
             .where(
                 Channel.id == channel_id,
@@ -131,55 +235,27 @@ class ChannelService:
                 UserChannel.is_active,
             )
         )
-        row = result.first()
-        if not row:
-            return None
-
-        channel, user_channel = row
-
-        # Get message count
-        msg_count_result = await db.execute(
-            select(func.count(Message.id)).where(Message.channel_id == channel.id)
-        )
-        message_count = msg_count_result.scalar() or 0
-
-        # Get media count
-        media_count_result = await db.execute(
-            select(func.count(Media.id)).where(Media.channel_id == channel.id)
-        )
-        media_count = media_count_result.scalar() or 0
-
-        return {
-            "id": channel.id,
-            "telegram_id": channel.telegram_id,
-            "username": channel.username,
-            "title": channel.title,
-            "channel_type": channel.channel_type,
-            "message_count": message_count,
-            "media_count": media_count,
-            "last_scraped_message_id": user_channel.last_scraped_message_id,
-            "scrape_media": user_channel.scrape_media,
-            "added_at": user_channel.added_at,
-        }
+        row = result.mappings().first()
+        return dict(row) if row else None
 
     @classmethod
     async def remove_channel(
         cls, db: AsyncSession, channel_id: uuid.UUID, user_id: uuid.UUID
     ) -> bool:
         """Remove a channel from user's tracking (soft delete)."""
-        result = await db.execute(
-            select(UserChannel).where(
+        removed = await db.scalar(
+            update(UserChannel)
+            .where(
                 UserChannel.channel_id == channel_id,
                 UserChannel.user_id == user_id,
             )
+            .values(is_active=False)
+            .returning(UserChannel.id)
         )
-        user_channel = result.scalar_one_or_none()
-
-        if not user_channel:
-            return False
-
-        user_channel.is_active = False
         await db.commit()
+        if removed is None:
+            return False
+        await invalidate("channels", user_id)
         return True
 
     @classmethod
@@ -202,91 +278,91 @@ class ChannelService:
         offset: int = 0,
         search_query: str | None = None,
         media_type: str | None = None,
-        date_from: str | None = None,
-        date_to: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
         sender_id: int | None = None,
+        after_date: datetime | None = None,
+        after_id: uuid.UUID | None = None,
     ) -> dict[str, Any]:
-        """Get messages for a channel with advanced filters."""
+        """
+        Get messages for a channel with advanced filters.
+
+        Pass `after_date`/`after_id` from the previous response's `next_cursor` for
+        keyset pagination; `offset` is ignored then and `total` is not computed.
+        """
         # Verify user has access to channel
-        result = await db.execute(
-            select(UserChannel).where(
-                UserChannel.channel_id == channel_id,
-                UserChannel.user_id == user_id,
-                UserChannel.is_active,
+        has_access = await db.scalar(
+            select(
+                exists().where(
+                    UserChannel.channel_id == channel_id,
+                    UserChannel.user_id == user_id,
+                    UserChannel.is_active,
+                )
             )
         )
-        if not result.scalar_one_or_none():
-            return {"messages": [], "total": 0, "limit": limit, "offset": offset}
-
-        # Build filters list
-        filters = [Message.channel_id == channel_id]
-
-        # Full-text search using indexed tsvector column (web-style syntax)
-        if search_query:
-            search_tsquery = func.websearch_to_tsquery("simple", search_query)
-            filters.append(Message.search_vector.op("@@")(search_tsquery))
-
-        # Media type filter
-        if media_type:
-            filters.append(Message.media_type == media_type)
-
-        # Date range filters
-        if date_from:
-            try:
-                from_date = datetime.strptime(date_from, "%Y-%m-%d").replace(tzinfo=UTC)
-                filters.append(Message.date >= from_date)
-            except ValueError:
-                pass  # Invalid date format, skip filter
-
-        if date_to:
-            try:
-                to_date = datetime.strptime(date_to, "%Y-%m-%d").replace(
-                    hour=23, minute=59, second=59, tzinfo=UTC
-                )
-                filters.append(Message.date <= to_date)
-            except ValueError:
-                pass  # Invalid date format, skip filter
-
-        # Sender filter
-        if sender_id:
-            filters.append(Message.sender_id == sender_id)
-
-        # Combine all filters
-        combined_filter = and_(*filters)
-
-        # Get total count
-        count_result = await db.execute(select(func.count(Message.id)).where(combined_filter))
-        total = count_result.scalar() or 0
+        if not has_access:
+            return {
+                "messages": [],
+                "total": 0,
+                "limit": limit,
+                "offset": offset,
+                "next_cursor": None,
+            }
+
+        # Date range filters cover whole days (UTC)
+        from_date = datetime.combine(date_from, time.min, UTC) if date_from else None
+        to_date = datetime.combine(date_to, time(23, 59, 59), UTC) if date_to else None
+
+        filters = {
+            "search": search_query or None,
+            "media_type": media_type or None,
+            "date_from": from_date,
+            "date_to": to_date,
+            "sender_id": sender_id or None,
+        }
+        key = tuple(filters[name] is not None for name, _ in _OPTIONAL_FILTERS)
+        params = {
+            "limit": limit,
+            "offset": offset,
+            "channel_id": channel_id,
+            **{name: value for name, value in filters.items() if value is not None},
+        }
 
-        # Get messages
-        result = await db.execute(
-            select(Message)
-            .where(combined_filter)
-            .order_by(Message.date.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-        messages = result.scalars().all()
+        if after_date is not None and after_id is not None:
+            result = await db.execute(
+                _messages_after_stmt(key),
+                {**params, "after_date": after_date, "after_id": after_id},
+            )
+            rows = result.all()
+            total = None
+        else:
+            # Get the page and the total match count in one query
+            result = await db.execute(_messages_page_stmt(key), params)
+            rows = result.all()
+            total = await cls._messages_total(db, rows, key, params)
+
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = {"after_date": last.date, "after_id": last.id}
 
         return {
-            "messages": [
-                {
-                    "id": msg.id,
-                    "telegram_message_id": msg.telegram_message_id,
-                    "date": msg.date,
-                    "sender_id": msg.sender_id,
-                    "first_name": msg.first_name,
-                    "last_name": msg.last_name,
-                    "username": msg.username,
-                    "message_text": msg.message_text,
-                    "media_type": msg.media_type,
-                    "views": msg.views,
-                    "forwards": msg.forwards,
-                    "reactions": msg.reactions,
-                }
-                for msg in messages
-            ],
+            "messages": MESSAGE_LIST_ADAPTER.validate_python(rows, from_attributes=True),
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
         }
+
+    @staticmethod
+    async def _messages_total(
+        db: AsyncSession, rows: list[Any], key: _FilterKey, params: dict[str, Any]
+    ) -> int:
+        """Total match count for an OFFSET page, read from its window column."""
+        if rows:
+            return rows[0].total
+        if params["offset"]:
+            # Page past the end carries no window row; count separately
+            count_result = await db.execute(_messages_count_stmt(key), params)
+            return count_result.scalar() or 0
+        return 0
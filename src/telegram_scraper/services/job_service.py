@@ -1,14 +1,44 @@
 """Job service for managing scraping jobs."""
 
+import asyncio
+import contextlib
+import logging
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import (
+    Integer,
+    Numeric,
+    cast,
+    column,
+    exists,
+    func,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import undefer
 
+from telegram_scraper.core.cache import cached, get_redis, invalidate
 from telegram_scraper.models.scraping_job import ScrapingJob
 from telegram_scraper.models.user_channel import UserChannel
+from telegram_scraper.schemas.job import JOB_LIST_ADAPTER
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Raised on cancel so running workers notice without polling Postgres; the TTL only
+# has to outlive a job run (the worker's job_timeout)
+CANCEL_FLAG_KEY = "scraper:job_cancelled:{}"
+CANCEL_FLAG_TTL = 3600
 
 
 class JobService:
@@ -25,26 +55,28 @@ class JobService:
     ) -> ScrapingJob:
         """Create a new scraping job."""
         # Verify user has access to channel
-        result = await db.execute(
-            select(UserChannel).where(
-                UserChannel.channel_id == channel_id,
-                UserChannel.user_id == user_id,
-                UserChannel.is_active,
+        has_access = await db.scalar(
+            select(
+                exists().where(
+                    UserChannel.channel_id == channel_id,
+                    UserChannel.user_id == user_id,
+                    UserChannel.is_active,
+                )
             )
         )
-        user_channel = result.scalar_one_or_none()
-        if not user_channel:
+        if not has_access:
             raise ValueError("Channel not found or not accessible")
 
         # Check for existing running job on this channel
-        result = await db.execute(
-            select(ScrapingJob).where(
-                ScrapingJob.channel_id == channel_id,
-                ScrapingJob.user_id == user_id,
-                ScrapingJob.status.in_(["pending", "running"]),
+        existing = await db.scalar(
+            select(
+                exists().where(
+                    ScrapingJob.channel_id == channel_id,
+                    ScrapingJob.user_id == user_id,
+                    ScrapingJob.status.in_(["pending", "running"]),
+                )
             )
         )
-        existing = result.scalar_one_or_none()
         if existing:
             raise ValueError("A job is already running for this channel")
 
@@ -60,10 +92,11 @@ class JobService:
         )
         db.add(job)
         await db.commit()
-        await db.refresh(job)
+        await invalidate("jobs", user_id)
         return job
 
     @classmethod
+    @cached("jobs", ttl=5)
     async def get_jobs(
         cls,
         db: AsyncSession,
@@ -71,9 +104,20 @@ class JobService:
         limit: int = 50,
         offset: int = 0,
         status_filter: str | None = None,
+        after_created_at: datetime | None = None,
+        after_id: uuid.UUID | None = None,
     ) -> dict[str, Any]:
-        """Get jobs for a user."""
-        query = select(ScrapingJob).where(ScrapingJob.user_id == user_id)
+        """
+        Get jobs for a user.
+
+        Pass `after_created_at`/`after_id` from the previous response's `next_cursor`
+        for keyset pagination; `offset` is ignored then.
+        """
+        query = (
+            select(ScrapingJob)
+            .options(undefer(ScrapingJob.job_metadata))
+            .where(ScrapingJob.user_id == user_id)
+        )
 
         if status_filter:
             query = query.where(ScrapingJob.status == status_filter)
@@ -86,32 +130,26 @@ class JobService:
         total = count_result.scalar() or 0
 
         # Get jobs
-        result = await db.execute(
-            query.order_by(ScrapingJob.created_at.desc()).limit(limit).offset(offset)
-        )
+        query = query.order_by(ScrapingJob.created_at.desc(), ScrapingJob.id.desc()).limit(limit)
+        if after_created_at is not None and after_id is not None:
+            query = query.where(
+                tuple_(ScrapingJob.created_at, ScrapingJob.id) < (after_created_at, after_id)
+            )
+        else:
+            query = query.offset(offset)
+        result = await db.execute(query)
         jobs = result.scalars().all()
 
+        next_cursor = None
+        if len(jobs) == limit:
+            next_cursor = {"after_created_at": jobs[-1].created_at, "after_id": jobs[-1].id}
+
         return {
-            "jobs": [
-                {
-                    "id": job.id,
-                    "channel_id": job.channel_id,
-                    "job_type": job.job_type,
-                    "status": job.status,
-                    "progress_percent": float(job.progress_percent),
-                    "messages_processed": job.messages_processed,
-                    "media_downloaded": job.media_downloaded,
-                    "error_message": job.error_message,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "created_at": job.created_at,
-                    "job_metadata": job.job_metadata,
-                }
-                for job in jobs
-            ],
+            "jobs": JOB_LIST_ADAPTER.validate_python(jobs, from_attributes=True),
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
         }
 
     @classmethod
@@ -120,7 +158,9 @@ class JobService:
     ) -> dict[str, Any] | None:
         """Get a specific job."""
         result = await db.execute(
-            select(ScrapingJob).where(
+            select(ScrapingJob)
+            .options(undefer(ScrapingJob.job_metadata))
+            .where(
                 ScrapingJob.id == job_id,
                 ScrapingJob.user_id == user_id,
             )
@@ -147,23 +187,43 @@ class JobService:
     @classmethod
     async def cancel_job(cls, db: AsyncSession, job_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Cancel a running job."""
-        result = await db.execute(
-            select(ScrapingJob).where(
+        cancelled = await db.scalar(
+            update(ScrapingJob)
+            .where(
                 ScrapingJob.id == job_id,
                 ScrapingJob.user_id == user_id,
+                ScrapingJob.status.in_(["pending", "running"]),
             )
+            .values(status="cancelled", completed_at=func.now())
+            .returning(ScrapingJob.id)
         )
-        job = result.scalar_one_or_none()
-        if not job:
-            return False
+        await db.commit()
+        if cancelled:
+            await invalidate("jobs", user_id)
+            try:
+                await cls.flag_cancelled(get_redis(), job_id)
+            except (RedisError, OSError) as e:
+                # The job row stays authoritative; the worker just won't stop early
+                logger.warning(f"Could not set cancel flag for job {job_id}: {e}")
+            return True
 
-        if job.status not in ["pending", "running"]:
+        # Nothing updated: tell "not found" apart from "already finished"
+        job_exists = await db.scalar(
+            select(exists().where(ScrapingJob.id == job_id, ScrapingJob.user_id == user_id))
+        )
+        if job_exists:
             raise ValueError("Can only cancel pending or running jobs")
+        return False
 
-        job.status = "cancelled"
-        job.completed_at = datetime.now(UTC)
-        await db.commit()
-        return True
+    @classmethod
+    async def flag_cancelled(cls, redis: Redis, job_id: uuid.UUID) -> None:
+        """Set the Redis cancel flag that running workers poll."""
+        await redis.set(CANCEL_FLAG_KEY.format(job_id), 1, ex=CANCEL_FLAG_TTL)
+
+    @classmethod
+    async def is_cancelled(cls, redis: Redis, job_id: uuid.UUID) -> bool:
+        """Check a job's Redis cancel flag."""
+        return bool(await redis.exists(CANCEL_FLAG_KEY.format(job_id)))
 
     @classmethod
     async def update_job_progress(
@@ -177,25 +237,164 @@ class JobService:
         error_message: str | None = None,
     ) -> None:
         """Update job progress (called by workers)."""
-        result = await db.execute(select(ScrapingJob).where(ScrapingJob.id == job_id))
-        job = result.scalar_one_or_none()
-        if not job:
-            return
+        changes: dict[str, Any] = {}
 
         if status:
-            job.status = status
-            if status == "running" and not job.started_at:
-                job.started_at = datetime.now(UTC)
-            elif status in ["completed", "failed", "cancelled"]:
-                job.completed_at = datetime.now(UTC)
+            changes["status"] = status
+            if status == "running":
+                changes["started_at"] = func.coalesce(ScrapingJob.started_at, func.now())
+            elif status in TERMINAL_JOB_STATUSES:
+                changes["completed_at"] = func.now()
 
         if progress_percent is not None:
-            job.progress_percent = progress_percent
+            changes["progress_percent"] = progress_percent
         if messages_processed is not None:
-            job.messages_processed = messages_processed
+            changes["messages_processed"] = messages_processed
         if media_downloaded is not None:
-            job.media_downloaded = media_downloaded
+            changes["media_downloaded"] = media_downloaded
         if error_message is not None:
-            job.error_message = error_message
+            changes["error_message"] = error_message
 
+        if not changes:
+            return
+
+        await db.execute(update(ScrapingJob).where(ScrapingJob.id == job_id).values(**changes))
         await db.commit()
+
+
+class JobProgressBuffer:
+    """
+    Coalesces worker progress updates in Redis and flushes them to Postgres in bulk.
+
+    Running jobs report progress with a Redis HSET (latest value wins); a background
+    loop drains the hash every `interval` seconds and applies all pending updates with
+    one multi-row UPDATE. Terminal statuses bypass the buffer and are written at once.
+    """
+
+    KEY = "scraper:job_progress"
+
+    def __init__(
+        self,
+        redis: Redis,
+        session_maker: async_sessionmaker[AsyncSession],
+        interval: float = 1.0,
+    ) -> None:
+        self.redis = redis
+        self.session_maker = session_maker
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write out anything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def update(
+        self,
+        job_id: uuid.UUID,
+        status: str | None = None,
+        progress_percent: float | None = None,
+        messages_processed: int | None = None,
+        media_downloaded: int | None = None,
+        error_message: str | None = None,
+    ) -> None:
+        """Record job progress; terminal statuses are written to the database immediately."""
+        if status in TERMINAL_JOB_STATUSES:
+            await self.redis.hdel(self.KEY, str(job_id))
+            async with self.session_maker() as db:
+                await JobService.update_job_progress(
+                    db,
+                    job_id,
+                    status=status,
+                    progress_percent=progress_percent,
+                    messages_processed=messages_processed,
+                    media_downloaded=media_downloaded,
+                    error_message=error_message,
+                )
+            return
+
+        await self.redis.hset(
+            self.KEY,
+            str(job_id),
+            orjson.dumps(
+                {
+                    "progress_percent": progress_percent,
+                    "messages_processed": messages_processed,
+                    "media_downloaded": media_downloaded,
+                }
+            ),
+        )
+
+    async def flush(self) -> int:
+        """Apply all buffered updates in one statement. Returns the number of jobs flushed."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(self.KEY)
+            pipe.delete(self.KEY)
+            buffered, _ = await pipe.execute()
+
+        if not buffered:
+            return 0
+
+        rows = []
+        for job_id, raw in buffered.items():
+            data = orjson.loads(raw)
+            rows.append(
+                (
+                    uuid.UUID(job_id.decode() if isinstance(job_id, bytes) else job_id),
+                    data["progress_percent"],
+                    data["messages_processed"],
+                    data["media_downloaded"],
+                )
+            )
+
+        progress = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("progress_percent", Numeric(5, 2)),
+            column("messages_processed", Integer),
+            column("media_downloaded", Integer),
+            name="progress",
+        ).data(rows)
+
+        # Only running jobs take buffered progress, so a late flush can't
+        # overwrite the final numbers of a completed/failed/cancelled job.
+        # The casts keep all-NULL VALUES columns (typed text by Postgres) valid.
+        stmt = (
+            update(ScrapingJob)
+            .where(
+                ScrapingJob.id == progress.c.id,
+                ScrapingJob.status.in_(["pending", "running"]),
+            )
+            .values(
+                progress_percent=func.coalesce(
+                    cast(progress.c.progress_percent, Numeric(5, 2)), ScrapingJob.progress_percent
+                ),
+                messages_processed=func.coalesce(
+                    cast(progress.c.messages_processed, Integer), ScrapingJob.messages_processed
+                ),
+                media_downloaded=func.coalesce(
+                    cast(progress.c.media_downloaded, Integer), ScrapingJob.media_downloaded
+                ),
+            )
+        )
+        async with self.session_maker() as db:
+            await db.execute(stmt, execution_options={"synchronize_session": False})
+            await db.commit()
+
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush job progress: {e}")
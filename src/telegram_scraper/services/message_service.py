@@ -0,0 +1,91 @@
+"""Message service for persisting scraped messages."""
+
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from telegram_scraper.models.message import COPY_THRESHOLD, Message
+
+# Full chunks go through COPY; a smaller tail uses a single multi-row INSERT
+BULK_INSERT_CHUNK_SIZE = COPY_THRESHOLD
+
+# Stored message IDs held in memory at once while a scrape skips known messages
+STORED_IDS_WINDOW = 50_000
+
+
+class MessageService:
+    """Service for bulk message persistence."""
+
+    @classmethod
+    async def bulk_insert(
+        cls,
+        db: AsyncSession,
+        rows: list[dict[str, Any]],
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+    ) -> Sequence[Row]:
+        """
+        Insert scraped message rows in chunks, skipping ones that already exist.
+
+        Returns (id, telegram_message_id) for the rows that were actually inserted.
+        The caller is responsible for committing.
+        """
+        inserted: list[Row] = []
+        for start in range(0, len(rows), chunk_size):
+            inserted.extend(await Message.bulk_upsert(db, rows[start : start + chunk_size]))
+        return inserted
+
+
+class StoredMessageIds:
+    """
+    Membership test for a channel's stored Telegram message IDs, asked in ascending order.
+
+    Instead of loading every ID above `after_message_id` at once, IDs are read in
+    keyset pages of `window` as the scan moves past the loaded range, so memory stays
+    bounded on channels with millions of messages. Each page uses its own short-lived
+    session, leaving the caller's session free for writes.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        channel_id: uuid.UUID,
+        after_message_id: int = 0,
+        window: int = STORED_IDS_WINDOW,
+    ) -> None:
+        self.session_maker = session_maker
+        self.channel_id = channel_id
+        self.window = window
+        self.max_id = 0  # highest stored ID loaded so far
+        self._ids: set[int] = set()
+        self._loaded_to = after_message_id
+        self._exhausted = False
+
+    async def contains(self, telegram_id: int) -> bool:
+        """Whether a message is stored; IDs below an earlier call may be forgotten."""
+        while telegram_id > self._loaded_to and not self._exhausted:
+            await self._load_next()
+        return telegram_id in self._ids
+
+    async def _load_next(self) -> None:
+        async with self.session_maker() as db:
+            ids = (
+                await db.scalars(
+                    select(Message.telegram_message_id)
+                    .where(
+                        Message.channel_id == self.channel_id,
+                        Message.telegram_message_id > self._loaded_to,
+                    )
+                    .order_by(Message.telegram_message_id)
+                    .limit(self.window)
+                )
+            ).all()
+        self._ids = set(ids)
+        if ids:
+            self.max_id = max(self.max_id, ids[-1])
+        if len(ids) < self.window:
+            self._exhausted = True
+        else:
+            self._loaded_to = ids[-1]
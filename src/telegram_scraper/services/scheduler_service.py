@@ -4,9 +4,11 @@ import logging
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, any_, bindparam, exists, func, select, true, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, selectinload
 
 from telegram_scraper.models.scraping_job import ScrapingJob
 from telegram_scraper.models.telegram_session import TelegramSession
@@ -15,13 +17,41 @@ from telegram_scraper.models.user_channel import UserChannel
 logger = logging.getLogger(__name__)
 
 
-async def get_due_schedules(db: AsyncSession) -> list[UserChannel]:
-    """Get all user_channels that are due for scheduled scraping."""
-    now = datetime.now(UTC)
+async def get_due_schedules(
+    db: AsyncSession,
+    now: datetime | None = None,
+) -> list[tuple[UserChannel, TelegramSession | None, bool]]:
+    """
+    Get all user_channels that are due for scheduled scraping.
+
+    Each schedule comes back with the user's authenticated Telegram session (or None)
+    and whether the channel already has a pending/running job, all in one query.
+    """
+    now = now or datetime.now(UTC)
+
+    session_subq = (
+        select(TelegramSession)
+        .where(
+            TelegramSession.user_id == UserChannel.user_id,
+            TelegramSession.is_authenticated,
+        )
+        .limit(1)
+        .lateral()
+    )
+    session_alias = aliased(TelegramSession, session_subq)
+    active_job = (
+        exists()
+        .where(
+            ScrapingJob.channel_id == UserChannel.channel_id,
+            ScrapingJob.status.in_(["pending", "running"]),
+        )
+        .label("has_active_job")
+    )
 
     result = await db.execute(
-        select(UserChannel)
-        .options(joinedload(UserChannel.channel), joinedload(UserChannel.user))
+        select(UserChannel, session_alias, active_job)
+        .outerjoin(session_subq, true())
+        .options(selectinload(UserChannel.channel), selectinload(UserChannel.user))
         .where(
             and_(
                 UserChannel.schedule_enabled,
@@ -30,7 +60,7 @@ async def get_due_schedules(db: AsyncSession) -> list[UserChannel]:
             )
         )
     )
-    return list(result.scalars().unique().all())
+    return [tuple(row) for row in result.all()]
 
 
 async def get_user_session(db: AsyncSession, user_id: UUID) -> TelegramSession | None:
@@ -48,15 +78,16 @@ async def get_user_session(db: AsyncSession, user_id: UUID) -> TelegramSession |
 
 async def has_active_job(db: AsyncSession, channel_id: UUID) -> bool:
     """Check if there's already an active job for this channel."""
-    result = await db.execute(
-        select(ScrapingJob).where(
-            and_(
-                ScrapingJob.channel_id == channel_id,
-                ScrapingJob.status.in_(["pending", "running"]),
+    return bool(
+        await db.scalar(
+            select(
+                exists().where(
+                    ScrapingJob.channel_id == channel_id,
+                    ScrapingJob.status.in_(["pending", "running"]),
+                )
             )
         )
     )
-    return result.scalar_one_or_none() is not None
 
 
 async def update_schedule(
@@ -76,18 +107,43 @@ async def update_schedule(
         user_channel.next_scheduled_at = None
 
     await db.commit()
-    await db.refresh(user_channel)
     return user_channel
 
 
-async def calculate_next_run(user_channel: UserChannel) -> datetime:
+async def calculate_next_run(user_channel: UserChannel, now: datetime | None = None) -> datetime:
     """Calculate the next scheduled run time."""
     interval = user_channel.schedule_interval_hours or 24
-    return datetime.now(UTC) + timedelta(hours=interval)
+    return (now or datetime.now(UTC)) + timedelta(hours=interval)
 
 
-async def mark_scheduled_run(db: AsyncSession, user_channel: UserChannel) -> None:
+async def mark_scheduled_run(
+    db: AsyncSession, user_channel: UserChannel, now: datetime | None = None
+) -> None:
     """Mark that a scheduled run has been triggered."""
-    user_channel.last_scheduled_at = datetime.now(UTC)
-    user_channel.next_scheduled_at = await calculate_next_run(user_channel)
+    now = now or datetime.now(UTC)
+    user_channel.last_scheduled_at = now
+    user_channel.next_scheduled_at = await calculate_next_run(user_channel, now)
+    await db.commit()
+
+
+async def mark_scheduled_runs(
+    db: AsyncSession, user_channel_ids: list[UUID], now: datetime
+) -> None:
+    """Mark a scheduler tick's runs as triggered for many user_channels in one UPDATE."""
+    if not user_channel_ids:
+        return
+
+    await db.execute(
+        update(UserChannel)
+        .where(UserChannel.id == any_(bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True)))))
+        .values(
+            last_scheduled_at=now,
+            # make_interval(years, months, weeks, days, hours)
+            next_scheduled_at=now
+            + func.make_interval(
+                0, 0, 0, 0, func.coalesce(UserChannel.schedule_interval_hours, 24)
+            ),
+        ),
+        {"ids": user_channel_ids},
+    )
     await db.commit()
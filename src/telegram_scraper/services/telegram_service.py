@@ -1,24 +1,36 @@
 """Telegram service for managing Telethon clients and authentication."""
 
+import asyncio
 import base64
+import functools
 import io
+import random
 import uuid
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
 import qrcode
+from cachetools import TTLCache
 from cryptography.fernet import Fernet
+from qrcode.image.svg import SvgPathImage
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from telethon import TelegramClient
 from telethon.sessions import StringSession
+from telethon.tl.functions import PingRequest
 from telethon.tl.functions.auth import ExportLoginTokenRequest, ImportLoginTokenRequest
-from telethon.tl.types import auth
+from telethon.tl.types import Channel, ChannelForbidden, auth
 
 from telegram_scraper.config import settings
 from telegram_scraper.models.telegram_session import TelegramSession
 
+try:
+    import rfernet
+except ImportError:  # optional "speedups" extra
+    rfernet = None
 
+
+@functools.cache
 def get_encryption_key() -> bytes:
     """Get or derive a valid Fernet key from settings."""
     key = settings.session_encryption_key.encode()
@@ -27,24 +39,98 @@ def get_encryption_key() -> bytes:
     return base64.urlsafe_b64encode(key.ljust(32)[:32])
 
 
+@functools.cache
+def _fernet() -> Any:
+    """
+    Fernet instance for session strings; the key is fixed for the process lifetime.
+
+    Uses the Rust rfernet binding when it is installed (same token format, less
+    per-call overhead) and falls back to cryptography's Fernet otherwise.
+    """
+    if rfernet is not None:
+        return rfernet.Fernet(get_encryption_key().decode())
+    return Fernet(get_encryption_key())
+
+
 def encrypt_session_string(session_string: str) -> str:
     """Encrypt a session string for storage."""
-    fernet = Fernet(get_encryption_key())
-    return fernet.encrypt(session_string.encode()).decode()
+    token = _fernet().encrypt(session_string.encode())
+    # rfernet returns the token as str, cryptography as bytes
+    return token if isinstance(token, str) else token.decode()
+
+
+def encrypt_many(session_strings: list[str]) -> list[str]:
+    """Encrypt many session strings (bulk re-encryption) with one Fernet instance."""
+    encrypt = _fernet().encrypt
+    tokens = [encrypt(session_string.encode()) for session_string in session_strings]
+    return [token if isinstance(token, str) else token.decode() for token in tokens]
 
 
 def decrypt_session_string(encrypted: str) -> str:
     """Decrypt a session string from storage."""
-    fernet = Fernet(get_encryption_key())
-    return fernet.decrypt(encrypted.encode()).decode()
+    if rfernet is not None:
+        return _fernet().decrypt(encrypted).decode()
+    return _fernet().decrypt(encrypted.encode()).decode()
+
+
+QRImageFormat = Literal["svg", "png"]
+
+
+def render_qr_image(data: str, image_format: QRImageFormat = "svg") -> str:
+    """
+    Render a QR code as a data URL.
+
+    SVG paths are a fraction of the size of the equivalent PNG and skip the raster
+    and zlib work; PNG is kept for clients that can't display SVG.
+    """
+    qr = qrcode.QRCode(version=1, box_size=10, border=5)
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    buffer = io.BytesIO()
+    if image_format == "png":
+        qr.make_image(fill_color="black", back_color="white").save(buffer, format="PNG")
+        mime = "image/png"
+    else:
+        qr.make_image(image_factory=SvgPathImage).save(buffer)
+        mime = "image/svg+xml"
+    # Encode straight from the buffer's memory, without a getvalue() copy
+    return f"data:{mime};base64,{base64.b64encode(buffer.getbuffer()).decode()}"
+
+
+# Disconnects scheduled for evicted clients; referenced until done so they aren't GC'd
+_pending_disconnects: set[asyncio.Task[Any]] = set()
+
+
+def _disconnect_later(client: TelegramClient) -> None:
+    task = asyncio.get_running_loop().create_task(client.disconnect())
+    _pending_disconnects.add(task)
+    task.add_done_callback(_pending_disconnects.discard)
+
+
+class _ClientCache(TTLCache):
+    """TTLCache of Telegram clients that disconnects the ones it evicts."""
+
+    def expire(self, time: Any = None) -> list[tuple[Any, Any]]:
+        expired = super().expire(time)
+        for _, client in expired:
+            _disconnect_later(client)
+        return expired
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, client = super().popitem()
+        _disconnect_later(client)
+        return key, client
 
 
 class TelegramService:
     """Service for managing Telegram sessions and clients."""
 
-    # Store active clients and auth state in memory
-    _clients: dict[str, TelegramClient] = {}
-    _auth_state: dict[str, dict[str, Any]] = {}
+    # Active clients (idle ones expire after an hour) and pending login state in memory
+    _clients: TTLCache[str, TelegramClient] = _ClientCache(maxsize=1024, ttl=3600)
+    _auth_state: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=512, ttl=600)
+    # Clients whose connection answered a ping in the last few seconds
+    _alive: TTLCache[str, bool] = TTLCache(maxsize=1024, ttl=5)
 
     @classmethod
     async def create_session(
@@ -65,7 +151,6 @@ class TelegramService:
         )
         db.add(session)
         await db.commit()
-        await db.refresh(session)
         return session
 
     @classmethod
@@ -79,13 +164,10 @@ class TelegramService:
         cls, db: AsyncSession, session_id: uuid.UUID, user_id: uuid.UUID
     ) -> TelegramSession | None:
         """Get a specific session by ID."""
-        result = await db.execute(
-            select(TelegramSession).where(
-                TelegramSession.id == session_id,
-                TelegramSession.user_id == user_id,
-            )
-        )
-        return result.scalar_one_or_none()
+        session = await db.get(TelegramSession, session_id)
+        if session is None or session.user_id != user_id:
+            return None
+        return session
 
     @classmethod
     async def delete_session(
@@ -123,11 +205,13 @@ class TelegramService:
 
         session_key = str(session_id)
 
-        # Return existing client if connected
-        if session_key in cls._clients:
-            client = cls._clients[session_key]
-            if client.is_connected():
-                return client
+        # Reuse the existing client (reconnecting it if the link dropped), renewing its TTL
+        client = cls._clients.get(session_key)
+        if client is not None:
+            if not await cls._is_alive(session_key, client):
+                await client.connect()
+            cls._clients[session_key] = client
+            return client
 
         # Create new client
         if session.session_string:
@@ -141,6 +225,23 @@ class TelegramService:
         cls._clients[session_key] = client
         return client
 
+    @classmethod
+    async def _is_alive(cls, session_key: str, client: TelegramClient) -> bool:
+        """Ping a client's connection, trusting a successful ping for a few seconds."""
+        if not client.is_connected():
+            return False
+        if session_key in cls._alive:
+            return True
+
+        try:
+            await client(PingRequest(ping_id=random.getrandbits(63)))
+        except Exception:
+            await client.disconnect()
+            return False
+
+        cls._alive[session_key] = True
+        return True
+
     @classmethod
     async def send_code(
         cls,
@@ -281,6 +382,7 @@ class TelegramService:
         db: AsyncSession,
         session_id: uuid.UUID,
         user_id: uuid.UUID,
+        image_format: QRImageFormat = "svg",
     ) -> dict[str, Any]:
         """Start QR code login process."""
         client = await cls.get_client(db, session_id, user_id)
@@ -289,6 +391,11 @@ class TelegramService:
 
         session_key = str(session_id)
 
+        # Repeat requests reuse the QR code while its token is still valid
+        auth_state = cls._auth_state.get(session_key, {})
+        if "qr_url" in auth_state and auth_state["expires"] > datetime.now(UTC):
+            return cls._qr_response(auth_state, image_format)
+
         try:
             result = await client(
                 ExportLoginTokenRequest(
@@ -300,34 +407,38 @@ class TelegramService:
 
             if isinstance(result, auth.LoginToken):
                 token = base64.urlsafe_b64encode(result.token).decode()
-                qr_url = f"tg://login?token={token}"
 
-                # Generate QR code image
-                qr = qrcode.QRCode(version=1, box_size=10, border=5)
-                qr.add_data(qr_url)
-                qr.make(fit=True)
-                img = qr.make_image(fill_color="black", back_color="white")
+                # Telethon decodes the token's expiry as a datetime
+                expires = result.expires
+                if not isinstance(expires, datetime):
+                    expires = datetime.fromtimestamp(expires, tz=UTC)
 
-                buffer = io.BytesIO()
-                img.save(buffer, format="PNG")
-                qr_image = base64.b64encode(buffer.getvalue()).decode()
-
-                cls._auth_state[session_key] = {
+                auth_state = {
                     "qr_token": result.token,
-                    "expires": result.expires,
-                }
-
-                return {
-                    "qr_url": qr_url,
-                    "qr_image": f"data:image/png;base64,{qr_image}",
-                    "expires_at": datetime.fromtimestamp(result.expires, tz=UTC).isoformat(),
+                    "qr_url": f"tg://login?token={token}",
+                    "expires": expires,
+                    "qr_images": {},
                 }
+                cls._auth_state[session_key] = auth_state
+                return cls._qr_response(auth_state, image_format)
 
             raise ValueError("Unexpected response from Telegram")
 
         except Exception as e:
             raise ValueError(f"Failed to start QR login: {str(e)}")
 
+    @staticmethod
+    def _qr_response(auth_state: dict[str, Any], image_format: QRImageFormat) -> dict[str, Any]:
+        """Build the QR login response, rendering each image format once per token."""
+        images = auth_state["qr_images"]
+        if image_format not in images:
+            images[image_format] = render_qr_image(auth_state["qr_url"], image_format)
+        return {
+            "qr_url": auth_state["qr_url"],
+            "qr_image": images[image_format],
+            "expires_at": auth_state["expires"].isoformat(),
+        }
+
     @classmethod
     async def check_qr_login(
         cls,
@@ -401,17 +512,24 @@ class TelegramService:
 
             for dialog in dialogs:
                 entity = dialog.entity
-                if hasattr(entity, "broadcast") or hasattr(entity, "megagroup"):
-                    channel_type = "channel" if getattr(entity, "broadcast", False) else "group"
-                    channels.append(
-                        {
-                            "id": entity.id,
-                            "title": dialog.title,
-                            "username": getattr(entity, "username", None),
-                            "type": channel_type,
-                            "participants_count": getattr(entity, "participants_count", None),
-                        }
-                    )
+                entity_type = type(entity)
+                if entity_type is Channel:
+                    username = entity.username
+                    participants_count = entity.participants_count
+                elif entity_type is ChannelForbidden:
+                    username = participants_count = None
+                else:
+                    # Users and basic chats can't be scraped as channels
+                    continue
+                channels.append(
+                    {
+                        "id": entity.id,
+                        "title": dialog.title,
+                        "username": username,
+                        "type": "channel" if entity.broadcast else "group",
+                        "participants_count": participants_count,
+                    }
+                )
 
             # Update last used
             session.last_used_at = datetime.now(UTC)
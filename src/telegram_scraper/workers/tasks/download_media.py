@@ -1,45 +1,88 @@
 """Media download task implementation."""
 
+import asyncio
 import logging
+import os
 import uuid
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from telethon import TelegramClient
-from telethon.sessions import StringSession
+from sqlalchemy import Row, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from telegram_scraper.config import settings
+from telegram_scraper.db import async_session_maker
 from telegram_scraper.models.channel import Channel
 from telegram_scraper.models.media import Media
-from telegram_scraper.models.telegram_session import TelegramSession
-from telegram_scraper.services.telegram_service import decrypt_session_string
+from telegram_scraper.workers.telegram import (
+    forget_entity_on,
+    get_telegram_client,
+    resolve_entity,
+)
 
 logger = logging.getLogger(__name__)
 
-
-async def get_db_session() -> AsyncSession:
-    """Create a database session for the worker."""
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    return async_session()
-
-
-async def get_telegram_client(db: AsyncSession, session_id: uuid.UUID) -> TelegramClient | None:
-    """Get a Telegram client for a session."""
-    result = await db.execute(select(TelegramSession).where(TelegramSession.id == session_id))
-    session = result.scalar_one_or_none()
-
-    if not session or not session.session_string:
+# Fallback extensions for documents that carry no file name
+_MIME_EXT: Mapping[str, str] = MappingProxyType(
+    {
+        "video/mp4": ".mp4",
+        "audio/mpeg": ".mp3",
+        "audio/ogg": ".ogg",
+        "image/jpeg": ".jpg",
+        "image/png": ".png",
+        "image/gif": ".gif",
+        "application/pdf": ".pdf",
+    }
+)
+
+
+def _ext_from_filename(name: str) -> str:
+    """Extension of a file name's last component (PurePath.suffix rules, either separator)."""
+    name = name.rpartition("/")[2].rpartition("\\")[2]
+    stem, dot, suffix = name.rpartition(".")
+    return dot + suffix if stem and suffix else ""
+
+
+def _pick_extension(media: Any) -> str:
+    """Pick a file extension for a message's media."""
+    document = getattr(media, "document", None)
+    if document:
+        for attr in document.attributes:
+            file_name = getattr(attr, "file_name", None)
+            if file_name:
+                ext = _ext_from_filename(file_name)
+                if ext:
+                    return ext
+                break
+        return _MIME_EXT.get(document.mime_type or "", ".bin")
+    if getattr(media, "photo", None) is not None:
+        return ".jpg"
+    return ""
+
+
+def _file_size(path: Path) -> int | None:
+    """Size of a downloaded file from a single stat call; None if nothing was written."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
         return None
 
-    string_session = StringSession(decrypt_session_string(session.session_string))
-    client = TelegramClient(string_session, session.api_id, session.api_hash)
-    await client.connect()
-    return client
+
+async def _release_claimed_media(db: AsyncSession, media_ids: list[uuid.UUID]) -> None:
+    """Put media claimed by an unfinished batch back to pending so it can be retried."""
+    try:
+        await db.rollback()
+        await db.execute(
+            update(Media)
+            .where(Media.id.in_(media_ids), Media.download_status == "downloading")
+            .values(download_status="pending")
+        )
+        await db.commit()
+    except Exception as e:
+        logger.error(f"Error releasing claimed media: {e}")
 
 
 async def download_single_media(
@@ -56,19 +99,18 @@ async def download_single_media(
     Returns:
         Dict with download results
     """
-    db = await get_db_session()
-    client = None
+    db = async_session_maker()
+    media = None
+    channel = None
 
     try:
         # Get media record
-        result = await db.execute(select(Media).where(Media.id == uuid.UUID(media_id)))
-        media = result.scalar_one_or_none()
+        media = await db.get(Media, uuid.UUID(media_id))
         if not media:
             return {"status": "error", "error": "Media not found"}
 
         # Get channel info
-        result = await db.execute(select(Channel).where(Channel.id == media.channel_id))
-        channel = result.scalar_one_or_none()
+        channel = await db.get(Channel, media.channel_id)
         if not channel:
             return {"status": "error", "error": "Channel not found"}
 
@@ -78,24 +120,16 @@ async def download_single_media(
         await db.commit()
 
         # Get Telegram client
-        client = await get_telegram_client(db, uuid.UUID(session_id))
+        session_uuid = uuid.UUID(session_id)
+        client = await get_telegram_client(db, session_uuid)
         if not client:
             media.download_status = "failed"
             media.error_message = "Could not create Telegram client"
             await db.commit()
             return {"status": "error", "error": "Could not create Telegram client"}
 
-        # Get dialogs to cache entities
-        await client.get_dialogs()
-
         # Get the channel entity
-        try:
-            entity = await client.get_entity(channel.telegram_id)
-        except Exception:
-            if channel.username:
-                entity = await client.get_entity(channel.username)
-            else:
-                raise ValueError(f"Could not find channel {channel.telegram_id}")
+        entity = await resolve_entity(client, session_uuid, channel.telegram_id, channel.username)
 
         # Get the message with media
         message = await client.get_messages(entity, ids=media.telegram_message_id)
@@ -111,27 +145,7 @@ async def download_single_media(
         channel_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate filename
-        ext = ""
-        if hasattr(message.media, "document") and message.media.document:
-            for attr in message.media.document.attributes:
-                if hasattr(attr, "file_name") and attr.file_name:
-                    ext = Path(attr.file_name).suffix
-                    break
-            if not ext:
-                mime = message.media.document.mime_type or ""
-                ext_map = {
-                    "video/mp4": ".mp4",
-                    "audio/mpeg": ".mp3",
-                    "audio/ogg": ".ogg",
-                    "image/jpeg": ".jpg",
-                    "image/png": ".png",
-                    "image/gif": ".gif",
-                    "application/pdf": ".pdf",
-                }
-                ext = ext_map.get(mime, ".bin")
-        elif hasattr(message.media, "photo"):
-            ext = ".jpg"
-
+        ext = _pick_extension(message.media)
         filename = f"{media.telegram_message_id}_{media.id}{ext}"
         file_path = channel_dir / filename
 
@@ -145,9 +159,7 @@ async def download_single_media(
         media.download_status = "completed"
         media.downloaded_at = datetime.now(UTC)
 
-        # Get file size
-        if file_path.exists():
-            media.file_size = file_path.stat().st_size
+        media.file_size = _file_size(file_path)
 
         await db.commit()
 
@@ -161,11 +173,12 @@ async def download_single_media(
 
     except Exception as e:
         logger.error(f"Error downloading media {media_id}: {e}")
+        forget_entity_on(e, session_id, channel.telegram_id if channel else None)
 
+        # Reuse the already-loaded record instead of selecting it again
         try:
-            result = await db.execute(select(Media).where(Media.id == uuid.UUID(media_id)))
-            media = result.scalar_one_or_none()
-            if media:
+            if media is not None:
+                await db.rollback()
                 media.download_status = "failed"
                 media.error_message = str(e)
                 await db.commit()
@@ -175,8 +188,6 @@ async def download_single_media(
         return {"status": "error", "error": str(e)}
 
     finally:
-        if client:
-            await client.disconnect()
         await db.close()
 
 
@@ -196,22 +207,31 @@ async def download_media_batch(
     Returns:
         Dict with batch download results
     """
-    db = await get_db_session()
-    client = None
+    db = async_session_maker()
+    channel_telegram_id = None
     downloaded = 0
     failed = 0
 
     try:
-        # Get pending media
+        channel_uuid = uuid.UUID(channel_id)
+
+        # Get pending media together with their channel in one query, projecting only
+        # the columns the download needs; status writes go through UPDATE statements
         result = await db.execute(
-            select(Media)
+            select(
+                Media.id,
+                Media.telegram_message_id,
+                Channel.telegram_id.label("channel_telegram_id"),
+                Channel.username.label("channel_username"),
+            )
+            .join(Channel, Media.channel_id == Channel.id)
             .where(
-                Media.channel_id == uuid.UUID(channel_id),
+                Media.channel_id == channel_uuid,
                 Media.download_status == "pending",
             )
             .limit(limit)
         )
-        media_list = result.scalars().all()
+        media_list = result.all()
 
         if not media_list:
             return {
@@ -221,94 +241,94 @@ async def download_media_batch(
                 "message": "No pending media",
             }
 
-        # Get channel info
-        result = await db.execute(select(Channel).where(Channel.id == uuid.UUID(channel_id)))
-        channel = result.scalar_one_or_none()
-        if not channel:
-            return {"status": "error", "error": "Channel not found"}
+        channel_telegram_id = media_list[0].channel_telegram_id
+        channel_username = media_list[0].channel_username
 
         # Get Telegram client
-        client = await get_telegram_client(db, uuid.UUID(session_id))
+        session_uuid = uuid.UUID(session_id)
+        client = await get_telegram_client(db, session_uuid)
         if not client:
             return {"status": "error", "error": "Could not create Telegram client"}
 
-        # Get dialogs and entity
-        await client.get_dialogs()
-        try:
-            entity = await client.get_entity(channel.telegram_id)
-        except Exception:
-            if channel.username:
-                entity = await client.get_entity(channel.username)
-            else:
-                raise ValueError(f"Could not find channel {channel.telegram_id}")
+        # Get the channel entity
+        entity = await resolve_entity(client, session_uuid, channel_telegram_id, channel_username)
 
         # Create download directory
         media_path = Path(settings.media_storage_path)
-        channel_dir = media_path / str(channel.id)
+        channel_dir = media_path / str(channel_uuid)
         channel_dir.mkdir(parents=True, exist_ok=True)
 
-        # Download each media
-        for media in media_list:
-            try:
-                media.download_status = "downloading"
-                media.download_attempts += 1
-                await db.commit()
-
-                # Get the message
-                message = await client.get_messages(entity, ids=media.telegram_message_id)
-                if not message or not message.media:
-                    media.download_status = "failed"
-                    media.error_message = "Message or media not found"
-                    await db.commit()
-                    failed += 1
-                    continue
-
-                # Generate filename
-                ext = ""
-                if hasattr(message.media, "document") and message.media.document:
-                    for attr in message.media.document.attributes:
-                        if hasattr(attr, "file_name") and attr.file_name:
-                            ext = Path(attr.file_name).suffix
-                            break
-                    if not ext:
-                        mime = message.media.document.mime_type or ""
-                        ext_map = {
-                            "video/mp4": ".mp4",
-                            "audio/mpeg": ".mp3",
-                            "audio/ogg": ".ogg",
-                            "image/jpeg": ".jpg",
-                            "image/png": ".png",
-                            "image/gif": ".gif",
-                            "application/pdf": ".pdf",
-                        }
-                        ext = ext_map.get(mime, ".bin")
-                elif hasattr(message.media, "photo"):
-                    ext = ".jpg"
-
-                filename = f"{media.telegram_message_id}_{media.id}{ext}"
-                file_path = channel_dir / filename
-
-                # Download
-                await client.download_media(message, file=str(file_path))
-
-                # Update record
-                media.file_path = str(file_path)
-                media.file_name = filename
-                media.download_status = "completed"
-                media.downloaded_at = datetime.now(UTC)
-                if file_path.exists():
-                    media.file_size = file_path.stat().st_size
-                await db.commit()
+        # Claim the whole batch in one statement
+        claimed = [media.id for media in media_list]
+        await db.execute(
+            update(Media)
+            .where(Media.id.in_(claimed))
+            .values(
+                download_status="downloading",
+                download_attempts=Media.download_attempts + 1,
+            )
+        )
+        await db.commit()
 
-                downloaded += 1
-                logger.info(f"Downloaded {downloaded}/{len(media_list)}: {filename}")
+        # Rows left claimed by a cancelled, timed-out or failed batch go back to pending
+        try:
+            # Download concurrently (bounded to stay within Telegram's per-session limits),
+            # collecting outcomes for a single write at the end
+            semaphore = asyncio.Semaphore(settings.max_concurrent_downloads)
+
+            async def download_one(media: Row) -> dict[str, Any]:
+                async with semaphore:
+                    # Get the message
+                    message = await client.get_messages(entity, ids=media.telegram_message_id)
+                    if not message or not message.media:
+                        raise ValueError("Message or media not found")
+
+                    # Generate filename
+                    ext = _pick_extension(message.media)
+                    filename = f"{media.telegram_message_id}_{media.id}{ext}"
+                    file_path = channel_dir / filename
+
+                    # Download
+                    await client.download_media(message, file=str(file_path))
+                    logger.info(f"Downloaded {filename}")
+
+                    return {
+                        "id": media.id,
+                        "file_path": str(file_path),
+                        "file_name": filename,
+                        "file_size": _file_size(file_path),
+                        "download_status": "completed",
+                        "downloaded_at": datetime.now(UTC),
+                    }
+
+            results = await asyncio.gather(
+                *(download_one(media) for media in media_list), return_exceptions=True
+            )
 
-            except Exception as e:
-                logger.error(f"Error downloading media {media.id}: {e}")
-                media.download_status = "failed"
-                media.error_message = str(e)
-                await db.commit()
-                failed += 1
+            completed: list[dict[str, Any]] = []
+            failures: list[dict[str, Any]] = []
+            for media, outcome in zip(media_list, results, strict=True):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Error downloading media {media.id}: {outcome}")
+                    forget_entity_on(outcome, session_id, channel_telegram_id)
+                    failures.append(
+                        {"id": media.id, "download_status": "failed", "error_message": str(outcome)}
+                    )
+                else:
+                    completed.append(outcome)
+            downloaded = len(completed)
+            failed = len(failures)
+
+            # Bulk UPDATE by primary key: one executemany per outcome, one commit
+            if completed:
+                await db.execute(update(Media), completed)
+            if failures:
+                await db.execute(update(Media), failures)
+            await db.commit()
+            claimed = []
+        finally:
+            if claimed:
+                await _release_claimed_media(db, claimed)
 
         return {
             "status": "completed",
@@ -319,9 +339,8 @@ async def download_media_batch(
 
     except Exception as e:
         logger.error(f"Error in batch download: {e}")
+        forget_entity_on(e, session_id, channel_telegram_id)
         return {"status": "error", "error": str(e), "downloaded": downloaded, "failed": failed}
 
     finally:
-        if client:
-            await client.disconnect()
         await db.close()
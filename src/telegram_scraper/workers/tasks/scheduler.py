@@ -1,30 +1,22 @@
 """Scheduler task for checking and queuing due scraping jobs."""
 
+import asyncio
 import logging
+from datetime import UTC, datetime
 
 from arq import ArqRedis
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert, update
 
-from telegram_scraper.config import settings
+from telegram_scraper.db import async_session_maker
 from telegram_scraper.models.scraping_job import ScrapingJob
 from telegram_scraper.services.scheduler_service import (
     get_due_schedules,
-    get_user_session,
-    has_active_job,
-    mark_scheduled_run,
+    mark_scheduled_runs,
 )
 
 logger = logging.getLogger(__name__)
 
 
-async def get_db_session() -> AsyncSession:
-    """Create a database session for the scheduler."""
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    return async_session()
-
-
 async def check_scheduled_jobs(ctx: dict) -> dict:
     """
     Check for due scheduled jobs and queue them.
@@ -33,65 +25,94 @@ async def check_scheduled_jobs(ctx: dict) -> dict:
     scheduled scraping jobs are due and queues them for execution.
     """
     redis: ArqRedis = ctx["redis"]
-    db = await get_db_session()
+    db = async_session_maker()
     jobs_queued = 0
+    # One timestamp for the whole tick; every run marked below shares it
+    now = datetime.now(UTC)
+    marked = []
 
     try:
         # Get all due schedules
-        due_schedules = await get_due_schedules(db)
+        due_schedules = await get_due_schedules(db, now)
         logger.info(f"Found {len(due_schedules)} due scheduled scrapes")
 
-        for user_channel in due_schedules:
-            try:
-                # Skip if there's already an active job for this channel
-                if await has_active_job(db, user_channel.channel_id):
-                    logger.info(f"Skipping channel {user_channel.channel_id} - job already active")
-                    # Still update next_scheduled_at to prevent retrying immediately
-                    await mark_scheduled_run(db, user_channel)
-                    continue
+        to_queue = []
+        for user_channel, session, has_active_job in due_schedules:
+            # Skip if there's already an active job for this channel
+            if has_active_job:
+                logger.info(f"Skipping channel {user_channel.channel_id} - job already active")
+                # Still update next_scheduled_at to prevent retrying immediately
+                marked.append(user_channel.id)
+                continue
 
-                # Get an authenticated session for this user
-                session = await get_user_session(db, user_channel.user_id)
-                if not session:
-                    logger.warning(f"No authenticated session for user {user_channel.user_id}")
-                    continue
+            # Skip users without an authenticated session
+            if not session:
+                logger.warning(f"No authenticated session for user {user_channel.user_id}")
+                continue
 
-                # Create a scraping job
-                job = ScrapingJob(
-                    user_id=user_channel.user_id,
-                    channel_id=user_channel.channel_id,
-                    session_id=session.id,
-                    job_type="scheduled",
-                    status="pending",
-                )
-                db.add(job)
-                await db.commit()
-                await db.refresh(job)
-
-                # Queue the scraping task
-                await redis.enqueue_job(
-                    "scrape_channel_task",
-                    job_id=str(job.id),
-                    user_id=str(user_channel.user_id),
-                    channel_id=str(user_channel.channel_id),
-                    session_id=str(session.id),
-                    from_message_id=user_channel.last_scraped_message_id or 0,
-                )
+            to_queue.append((user_channel, session))
+
+        if to_queue:
+            # Create every scraping job in one INSERT; ids come back in row order
+            result = await db.execute(
+                insert(ScrapingJob).returning(ScrapingJob.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "user_id": user_channel.user_id,
+                        "channel_id": user_channel.channel_id,
+                        "job_type": "scheduled",
+                        "status": "pending",
+                    }
+                    for user_channel, _ in to_queue
+                ],
+            )
+            job_ids = result.scalars().all()
+            await db.commit()
+
+            # Queue the scraping tasks concurrently
+            results = await asyncio.gather(
+                *(
+                    redis.enqueue_job(
+                        "scrape_channel_task",
+                        job_id=str(job_id),
+                        user_id=str(user_channel.user_id),
+                        channel_id=str(user_channel.channel_id),
+                        session_id=str(session.id),
+                        from_message_id=user_channel.last_scraped_message_id or 0,
+                    )
+                    for job_id, (user_channel, session) in zip(job_ids, to_queue, strict=True)
+                ),
+                return_exceptions=True,
+            )
+
+            failed_job_ids = []
+            for job_id, (user_channel, _), outcome in zip(job_ids, to_queue, results, strict=True):
+                if isinstance(outcome, BaseException):
+                    logger.error(
+                        f"Error queuing schedule for channel {user_channel.channel_id}: {outcome}"
+                    )
+                    failed_job_ids.append(job_id)
+                    continue
 
-                # Update the schedule
-                await mark_scheduled_run(db, user_channel)
+                marked.append(user_channel.id)
                 jobs_queued += 1
-
                 logger.info(
                     f"Queued scheduled scrape for channel {user_channel.channel.title} "
                     f"(user: {user_channel.user_id})"
                 )
 
-            except Exception as e:
-                logger.error(
-                    f"Error processing schedule for channel {user_channel.channel_id}: {e}"
+            # Jobs that never reached the queue must not count as active, or the
+            # schedule would be skipped forever; its next tick retries instead
+            if failed_job_ids:
+                await db.execute(
+                    update(ScrapingJob)
+                    .where(ScrapingJob.id.in_(failed_job_ids))
+                    .values(status="failed", error_message="Failed to queue job", completed_at=now)
                 )
-                continue
+                await db.commit()
+
+        # Update all handled schedules in a single statement
+        await mark_scheduled_runs(db, marked, now)
 
         return {"jobs_queued": jobs_queued}
 
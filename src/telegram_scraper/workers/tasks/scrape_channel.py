@@ -1,16 +1,23 @@
 """Channel scraping task implementation."""
 
+import asyncio
+import contextlib
 import logging
 import re
+import time
 import uuid
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from telethon import TelegramClient
-from telethon.sessions import StringSession
 from telethon.tl.types import (
     Message as TelegramMessage,
 )
@@ -21,142 +28,436 @@ from telethon.tl.types import (
 )
 
 from telegram_scraper.config import settings
+from telegram_scraper.db import async_session_maker
 from telegram_scraper.models.channel import Channel
 from telegram_scraper.models.keyword_alert import KeywordAlert, KeywordMatch
 from telegram_scraper.models.media import Media
-from telegram_scraper.models.message import Message
 from telegram_scraper.models.scraping_job import ScrapingJob
-from telegram_scraper.models.telegram_session import TelegramSession
 from telegram_scraper.models.user_channel import UserChannel
-from telegram_scraper.services.telegram_service import decrypt_session_string
+from telegram_scraper.services.job_service import JobProgressBuffer, JobService
+from telegram_scraper.services.message_service import MessageService, StoredMessageIds
+from telegram_scraper.workers.telegram import (
+    forget_entity_on,
+    get_telegram_client,
+    resolve_entity,
+)
 
 logger = logging.getLogger(__name__)
 
+# Channels of one continuous job scraped at the same time over its shared client
+CONTINUOUS_SCRAPE_CONCURRENCY = 4
+
+# Seconds between checks of a running scrape's cancel flag
+CANCEL_CHECK_INTERVAL = 2.0
+
+# Statements that run per batch, check or round are built once with bindparams, so
+# each run only binds values and the SQL text stays identical for asyncpg's prepared
+# statement cache
+_JOB_STATUS = select(ScrapingJob.status).where(ScrapingJob.id == bindparam("job_id"))
+
+# Active alerts of a user for one channel, or for all channels (channel_id is NULL)
+_ACTIVE_ALERTS = select(KeywordAlert).where(
+    KeywordAlert.user_id == bindparam("user_id"),
+    KeywordAlert.is_active,
+    (KeywordAlert.channel_id == bindparam("channel_id")) | (KeywordAlert.channel_id.is_(None)),
+)
+
+# Incremented in SQL so concurrent scrapes of other channels don't lose counts
+_RECORD_ALERT_MATCHES = (
+    update(KeywordAlert)
+    .where(KeywordAlert.id == bindparam("alert_id"))
+    .values(
+        match_count=KeywordAlert.match_count + bindparam("matches"),
+        last_match_at=bindparam("now"),
+    )
+)
+
+_LAST_SCRAPED_MESSAGE_ID = select(UserChannel.last_scraped_message_id).where(
+    UserChannel.user_id == bindparam("user_id"),
+    UserChannel.channel_id == bindparam("channel_id"),
+)
+
+
+async def _job_cancelled(redis: Redis, db: AsyncSession, job_uuid: uuid.UUID) -> bool:
+    """Check a job's Redis cancel flag, reading the job row if Redis is unavailable."""
+    try:
+        return await JobService.is_cancelled(redis, job_uuid)
+    except (RedisError, OSError) as e:
+        logger.warning(f"Cancel flag check failed for job {job_uuid}: {e}")
+        # A column select always reads the current value, where re-selecting the ORM
+        # row would return the instance cached in the session
+        return await db.scalar(_JOB_STATUS, {"job_id": job_uuid}) == "cancelled"
+
 
 async def check_keyword_alerts(
     db: AsyncSession,
     user_id: uuid.UUID,
     channel_id: uuid.UUID,
-    message: Message,
-    message_text: str | None,
+    messages: list[tuple[uuid.UUID, str | None]],
 ) -> int:
     """
-    Check message against user's keyword alerts and create matches.
+    Check a batch of new (message id, text) pairs against the user's keyword alerts.
 
-    Returns the number of matches found.
+    Alerts are loaded once per batch; matches are written with one executemany and
+    each alert's stats with one UPDATE. Returns the number of matches found.
     """
-    if not message_text:
+    messages = [(message_id, text) for message_id, text in messages if text]
+    if not messages:
         return 0
 
     # Get active keyword alerts for this user
-    # Either alerts for this specific channel or alerts for all channels (channel_id is NULL)
-    result = await db.execute(
-        select(KeywordAlert).where(
-            KeywordAlert.user_id == user_id,
-            KeywordAlert.is_active,
-            (KeywordAlert.channel_id == channel_id) | (KeywordAlert.channel_id.is_(None)),
-        )
-    )
-    alerts = result.scalars().all()
+    result = await db.scalars(_ACTIVE_ALERTS, {"user_id": user_id, "channel_id": channel_id})
+    alerts = result.all()
 
-    matches_found = 0
-    now = datetime.now(UTC)
+    matches: list[dict[str, Any]] = []
+    match_counts: dict[uuid.UUID, int] = {}
 
     for alert in alerts:
-        matched = False
-        matched_text = None
-
         if alert.is_regex:
             # Regex matching
             flags = 0 if alert.is_case_sensitive else re.IGNORECASE
             try:
-                match = re.search(alert.keyword, message_text, flags)
-                if match:
-                    matched = True
-                    # Get context around match (50 chars before/after)
-                    start = max(0, match.start() - 50)
-                    end = min(len(message_text), match.end() + 50)
-                    matched_text = message_text[start:end]
+                pattern = re.compile(alert.keyword, flags)
             except re.error:
                 # Invalid regex, skip
                 continue
         else:
-            # Plain text matching
-            search_text = message_text if alert.is_case_sensitive else message_text.lower()
             keyword = alert.keyword if alert.is_case_sensitive else alert.keyword.lower()
 
-            idx = search_text.find(keyword)
-            if idx != -1:
-                matched = True
-                # Get context around match
-                start = max(0, idx - 50)
-                end = min(len(message_text), idx + len(keyword) + 50)
-                matched_text = message_text[start:end]
-
-        if matched:
-            # Create match record
-            match_record = KeywordMatch(
-                keyword_alert_id=alert.id,
-                message_id=message.id,
-                channel_id=channel_id,
-                matched_text=matched_text,
-            )
-            db.add(match_record)
+        for message_id, message_text in messages:
+            matched_text = None
+            if alert.is_regex:
+                match = pattern.search(message_text)
+                if match:
+                    # Get context around match (50 chars before/after)
+                    start = max(0, match.start() - 50)
+                    end = min(len(message_text), match.end() + 50)
+                    matched_text = message_text[start:end]
+            else:
+                # Plain text matching
+                search_text = message_text if alert.is_case_sensitive else message_text.lower()
+                idx = search_text.find(keyword)
+                if idx != -1:
+                    # Get context around match
+                    start = max(0, idx - 50)
+                    end = min(len(message_text), idx + len(keyword) + 50)
+                    matched_text = message_text[start:end]
+
+            if matched_text is not None:
+                matches.append(
+                    {
+                        "keyword_alert_id": alert.id,
+                        "message_id": message_id,
+                        "channel_id": channel_id,
+                        "matched_text": matched_text,
+                    }
+                )
+                match_counts[alert.id] = match_counts.get(alert.id, 0) + 1
+                logger.info(f"Keyword match found: '{alert.keyword}' in message {message_id}")
+
+    if matches:
+        await db.execute(insert(KeywordMatch), matches)
+        # Run through the connection as a plain executemany, not an ORM bulk update
+        now = datetime.now(UTC)
+        conn = await db.connection()
+        await conn.execute(
+            _RECORD_ALERT_MATCHES,
+            [
+                {"alert_id": alert_id, "matches": count, "now": now}
+                for alert_id, count in match_counts.items()
+            ],
+        )
+
+    return len(matches)
 
-            # Update alert stats
-            alert.match_count += 1
-            alert.last_match_at = now
 
-            matches_found += 1
-            logger.info(f"Keyword match found: '{alert.keyword}' in message {message.id}")
+async def flush_message_batch(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    channel_id: uuid.UUID,
+    batch: list[dict[str, Any]],
+    media_types: dict[int, str],
+) -> tuple[int, int]:
+    """
+    Upsert a batch of message rows and queue media for the newly inserted ones.
 
-    return matches_found
+    Returns (messages inserted, media rows created).
+    """
+    inserted = await MessageService.bulk_insert(db, batch)
+    texts = {row["telegram_message_id"]: row["message_text"] for row in batch}
+
+    media_rows: list[dict[str, Any]] = []
+    alert_candidates: list[tuple[uuid.UUID, str | None]] = []
+    for message_id, telegram_message_id in inserted:
+        media_type = media_types.get(telegram_message_id)
+        if media_type:
+            media_rows.append(
+                {
+                    "message_id": message_id,
+                    "channel_id": channel_id,
+                    "telegram_message_id": telegram_message_id,
+                    "media_type": media_type,
+                    "download_status": "pending",
+                }
+            )
 
+        alert_candidates.append((message_id, texts.get(telegram_message_id)))
 
-async def get_db_session() -> AsyncSession:
-    """Create a database session for the worker."""
-    engine = create_async_engine(settings.database_url, echo=False)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    return async_session()
+    # One executemany for the batch's media instead of an ORM insert per row
+    if media_rows:
+        await db.execute(insert(Media), media_rows)
 
+    await check_keyword_alerts(db, user_id, channel_id, alert_candidates)
 
-async def get_telegram_client(db: AsyncSession, session_id: uuid.UUID) -> TelegramClient | None:
-    """Get a Telegram client for a session."""
-    result = await db.execute(select(TelegramSession).where(TelegramSession.id == session_id))
-    session = result.scalar_one_or_none()
+    await db.commit()
+    return len(inserted), len(media_rows)
 
-    if not session or not session.session_string:
-        return None
 
-    string_session = StringSession(decrypt_session_string(session.session_string))
-    client = TelegramClient(string_session, session.api_id, session.api_hash)
-    await client.connect()
-    return client
+def _document_media_type(media: MessageMediaDocument) -> str:
+    """Classify a document by its MIME type."""
+    doc = media.document
+    if not doc:
+        return "other"
+    mime = doc.mime_type or ""
+    if mime.startswith("video"):
+        return "video"
+    elif mime.startswith("audio"):
+        return "audio"
+    elif mime.startswith("image"):
+        return "photo"
+    return "document"
+
+
+# TL media classes are concrete, so an exact type lookup replaces the isinstance chain
+_MEDIA_TYPES: Mapping[type, Callable[[Any], str]] = MappingProxyType(
+    {
+        MessageMediaPhoto: lambda media: "photo",
+        MessageMediaDocument: _document_media_type,
+        MessageMediaWebPage: lambda media: "webpage",
+    }
+)
 
 
 def get_media_type(message: TelegramMessage) -> str | None:
     """Determine the media type from a Telegram message."""
-    if not message.media:
+    media = message.media
+    if not media:
         return None
 
-    if isinstance(message.media, MessageMediaPhoto):
-        return "photo"
-    elif isinstance(message.media, MessageMediaDocument):
-        doc = message.media.document
-        if doc:
-            mime = doc.mime_type or ""
-            if mime.startswith("video"):
-                return "video"
-            elif mime.startswith("audio"):
-                return "audio"
-            elif mime.startswith("image"):
-                return "photo"
-            else:
-                return "document"
-    elif isinstance(message.media, MessageMediaWebPage):
-        return "webpage"
+    classify = _MEDIA_TYPES.get(type(media))
+    return classify(media) if classify else "other"
+
+
+@dataclass
+class ScrapeCounts:
+    """Running totals of a scrape, kept readable when the scrape fails midway."""
+
+    messages_processed: int = 0
+    media_found: int = 0
+
+
+async def scrape_messages(
+    db: AsyncSession,
+    client: TelegramClient,
+    channel: Channel,
+    session_uuid: uuid.UUID,
+    user_uuid: uuid.UUID,
+    job_uuid: uuid.UUID,
+    counts: ScrapeCounts,
+    redis: Redis,
+    progress: JobProgressBuffer | None = None,
+    from_message_id: int = 0,
+    scrape_media: bool = True,
+) -> None:
+    """
+    Store a channel's messages newer than `from_message_id`.
+
+    Stops early once the job's cancel flag is raised in `redis`. Totals accumulate in
+    `counts`; progress percentages are only reported when a `progress` buffer is given.
+    """
+    # Get the Telegram entity (cached per session across jobs)
+    entity = await resolve_entity(client, session_uuid, channel.telegram_id, channel.username)
+    logger.info(f"Scraping channel: {channel.title} ({channel.telegram_id})")
+
+    # Get total message count estimate for progress calculation
+    total_messages_estimate = 0
+    if progress is not None:
+        try:
+            # Approximate the total by the newest message's ID (one GetHistory call)
+            latest = await client.get_messages(entity, limit=1)
+            if latest:
+                total_messages_estimate = latest[0].id
+            logger.info(f"Estimated total messages: {total_messages_estimate}")
+        except Exception as e:
+            logger.warning(f"Could not estimate total messages: {e}")
+            total_messages_estimate = 10000  # Fallback estimate
+
+    batch: list[dict[str, Any]] = []
+    media_types: dict[int, str] = {}
+    batch_size = settings.batch_size
+    scanned = 0
+    progress_percent = 0.0
+
+    # Already-stored messages are skipped in memory instead of being rebuilt and
+    # sent to the database only to hit the upsert's conflict clause. The IDs are
+    # paged in as the oldest-first scan advances, so memory stays bounded.
+    stored_ids = StoredMessageIds(async_session_maker, channel.id, from_message_id)
+    last_message_id = 0
+
+    # Telegram fetches and database writes overlap: the producer turns messages into
+    # rows while the consumer flushes batches. Only the consumer touches the session.
+    # The bounded queue holds back the producer when Postgres falls behind.
+    queue: asyncio.Queue[tuple[dict[str, Any], str | None] | Exception | None] = asyncio.Queue(
+        maxsize=batch_size * 4
+    )
 
-    return "other"
+    async def produce() -> None:
+        nonlocal scanned
+        try:
+            async for message in client.iter_messages(
+                entity,
+                min_id=from_message_id,
+                reverse=True,  # Start from oldest
+                wait_time=settings.scrape_history_wait_time,
+            ):
+                if not isinstance(message, TelegramMessage):
+                    continue
+                scanned += 1
+
+                # Repeats within this scan are left to the upsert's conflict clause
+                if await stored_ids.contains(message.id):
+                    continue
+
+                media_type = get_media_type(message)
+
+                # Telethon decodes dates as UTC-aware already; only convert the odd one out
+                date = message.date
+                if date.tzinfo is not UTC:
+                    date = date.astimezone(UTC) if date.tzinfo else date.replace(tzinfo=UTC)
+
+                # Extract sender info
+                sender_id = None
+                first_name = None
+                last_name = None
+                username = None
+
+                if message.sender:
+                    sender_id = message.sender.id
+                    first_name = getattr(message.sender, "first_name", None)
+                    last_name = getattr(message.sender, "last_name", None)
+                    username = getattr(message.sender, "username", None)
+
+                # Extract reactions, encoded here once so batch flushes don't serialize
+                reactions = None
+                if message.reactions:
+                    reactions = orjson.dumps(
+                        {
+                            "results": [
+                                {
+                                    "emoji": str(r.reaction),
+                                    "count": r.count,
+                                }
+                                for r in message.reactions.results
+                            ]
+                        }
+                    ).decode()
+
+                row = {
+                    "channel_id": channel.id,
+                    "telegram_message_id": message.id,
+                    "date": date,
+                    "sender_id": sender_id,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "username": username,
+                    "message_text": message.text or message.message,
+                    "media_type": media_type,
+                    "reply_to_message_id": message.reply_to_msg_id if message.reply_to else None,
+                    "post_author": message.post_author,
+                    "views": message.views,
+                    "forwards": message.forwards,
+                    "reactions": reactions,
+                }
+
+                # Track media
+                if not (media_type and scrape_media and media_type not in ["webpage"]):
+                    media_type = None
+                await queue.put((row, media_type))
+        except Exception as e:
+            # Re-raised by the consumer, in the task that owns the job
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    next_cancel_check = 0.0
+    try:
+        while (item := await queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+
+            # Check if job was cancelled (a Redis read, at most every few seconds)
+            now = time.monotonic()
+            if now >= next_cancel_check:
+                next_cancel_check = now + CANCEL_CHECK_INTERVAL
+                if await _job_cancelled(redis, db, job_uuid):
+                    logger.info(f"Job {job_uuid} was cancelled")
+                    break
+
+            row, media_type = item
+            batch.append(row)
+            if row["telegram_message_id"] > last_message_id:
+                last_message_id = row["telegram_message_id"]
+            if media_type:
+                media_types[row["telegram_message_id"]] = media_type
+
+            # Batch insert; existing messages are skipped by the upsert
+            if len(batch) >= batch_size:
+                inserted, media_created = await flush_message_batch(
+                    db, user_uuid, channel.id, batch, media_types
+                )
+                counts.messages_processed += inserted
+                counts.media_found += media_created
+                batch = []
+                media_types = {}
+
+                if progress is not None:
+                    # Update progress (buffered in Redis, flushed to the DB in bulk)
+                    if total_messages_estimate > 0:
+                        progress_percent = min(95, (scanned / total_messages_estimate) * 100)
+                    await progress.update(
+                        job_uuid,
+                        progress_percent=progress_percent,
+                        messages_processed=counts.messages_processed,
+                        media_downloaded=counts.media_found,
+                    )
+
+                logger.info(
+                    f"Processed {counts.messages_processed} messages ({progress_percent:.1f}%)..."
+                )
+    finally:
+        # No-op once the producer has finished; stops it on cancellation or error
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+    # Insert remaining batch
+    if batch:
+        inserted, media_created = await flush_message_batch(
+            db, user_uuid, channel.id, batch, media_types
+        )
+        counts.messages_processed += inserted
+        counts.media_found += media_created
+
+    # Update user_channel with last scraped message; every queued row was flushed
+    # above, and the ID pages give the highest stored ID seen, so no max() query is needed
+    if last_message_id:
+        await db.execute(
+            update(UserChannel)
+            .where(UserChannel.user_id == user_uuid, UserChannel.channel_id == channel.id)
+            .values(last_scraped_message_id=max(last_message_id, stored_ids.max_id))
+        )
+        await db.commit()
 
 
 async def scrape_channel(
@@ -164,6 +465,8 @@ async def scrape_channel(
     user_id: str,
     channel_id: str,
     session_id: str,
+    progress: JobProgressBuffer,
+    redis: Redis,
     from_message_id: int = 0,
     scrape_media: bool = True,
 ) -> dict[str, Any]:
@@ -175,266 +478,280 @@ async def scrape_channel(
         user_id: The user ID
         channel_id: The channel database ID
         session_id: The Telegram session ID
+        progress: Buffer that coalesces job progress updates
+        redis: Redis connection holding job cancel flags
         from_message_id: Start scraping from this message ID (for incremental)
         scrape_media: Whether to queue media downloads
 
     Returns:
         Dict with job results
     """
-    db = await get_db_session()
-    client = None
-    messages_processed = 0
-    media_found = 0
+    # Parse IDs once; the UUID objects bind natively (16-byte binary) through asyncpg
+    job_uuid = uuid.UUID(job_id)
+    user_uuid = uuid.UUID(user_id)
+    channel_uuid = uuid.UUID(channel_id)
+    session_uuid = uuid.UUID(session_id)
+
+    db = async_session_maker()
+    channel = None
+    counts = ScrapeCounts()
 
     try:
-        # Update job status to running
-        result = await db.execute(select(ScrapingJob).where(ScrapingJob.id == uuid.UUID(job_id)))
-        job = result.scalar_one_or_none()
-        if job:
-            job.status = "running"
-            job.started_at = datetime.now(UTC)
-            await db.commit()
+        # Update job status to running, unless it was cancelled or already finished;
+        # a running job is an ARQ retry after its worker died mid-job
+        claimed = await db.scalar(
+            update(ScrapingJob)
+            .where(ScrapingJob.id == job_uuid, ScrapingJob.status.in_(["pending", "running"]))
+            .values(status="running", started_at=datetime.now(UTC))
+            .returning(ScrapingJob.id)
+        )
+        await db.commit()
+        if claimed is None:
+            logger.info(f"Scrape job {job_id} was cancelled or already finished, skipping")
+            return {"job_id": job_id, "status": "skipped", "messages_processed": 0}
 
         # Get channel info
-        result = await db.execute(select(Channel).where(Channel.id == uuid.UUID(channel_id)))
-        channel = result.scalar_one_or_none()
+        channel = await db.get(Channel, channel_uuid)
         if not channel:
             raise ValueError(f"Channel {channel_id} not found")
 
         # Get Telegram client
-        client = await get_telegram_client(db, uuid.UUID(session_id))
+        client = await get_telegram_client(db, session_uuid)
         if not client:
             raise ValueError("Could not create Telegram client")
 
-        # Get the Telegram entity - need to get dialogs first to cache entities
-        await client.get_dialogs()
-
-        # Now get the entity
-        try:
-            entity = await client.get_entity(channel.telegram_id)
-        except Exception:
-            # Try by username if available
-            if channel.username:
-                entity = await client.get_entity(channel.username)
-            else:
-                raise ValueError(f"Could not find channel {channel.telegram_id}")
-        logger.info(f"Scraping channel: {channel.title} ({channel.telegram_id})")
+        await scrape_messages(
+            db,
+            client,
+            channel,
+            session_uuid,
+            user_uuid,
+            job_uuid,
+            counts,
+            redis,
+            progress=progress,
+            from_message_id=from_message_id,
+            scrape_media=scrape_media,
+        )
 
-        # Get total message count estimate for progress calculation
-        total_messages_estimate = 0
-        try:
-            # Get the channel's full info to estimate total messages
-            await client.get_entity(entity)
-            # Try to get message count - this works for channels/supergroups
-            async for msg in client.iter_messages(entity, limit=1):
-                if msg:
-                    total_messages_estimate = msg.id  # Approximate total by highest message ID
-                    break
-            logger.info(f"Estimated total messages: {total_messages_estimate}")
-        except Exception as e:
-            logger.warning(f"Could not estimate total messages: {e}")
-            total_messages_estimate = 10000  # Fallback estimate
+        # Update job as completed; a later progress flush skips finished jobs
+        await db.execute(
+            update(ScrapingJob)
+            .where(ScrapingJob.id == job_uuid, ScrapingJob.status != "cancelled")
+            .values(
+                status="completed",
+                progress_percent=100,
+                messages_processed=counts.messages_processed,
+                media_downloaded=counts.media_found,
+                completed_at=datetime.now(UTC),
+            )
+        )
+        await db.commit()
 
-        # Iterate through messages
-        batch = []
-        batch_size = settings.batch_size
+        logger.info(
+            f"Completed scraping job {job_id}: {counts.messages_processed} messages, "
+            f"{counts.media_found} media"
+        )
 
-        async for message in client.iter_messages(
-            entity,
-            min_id=from_message_id,
-            reverse=True,  # Start from oldest
-        ):
-            if not isinstance(message, TelegramMessage):
-                continue
+        return {
+            "job_id": job_id,
+            "status": "completed",
+            "messages_processed": counts.messages_processed,
+            "media_found": counts.media_found,
+        }
 
-            # Check if job was cancelled
-            if messages_processed % 100 == 0:
-                result = await db.execute(
-                    select(ScrapingJob).where(ScrapingJob.id == uuid.UUID(job_id))
-                )
-                job = result.scalar_one_or_none()
-                if job and job.status == "cancelled":
-                    logger.info(f"Job {job_id} was cancelled")
-                    break
+    except Exception as e:
+        logger.error(f"Error in scrape job {job_id}: {e}")
+        forget_entity_on(e, session_id, channel.telegram_id if channel else None)
 
-            # Check if message already exists
-            result = await db.execute(
-                select(Message).where(
-                    Message.channel_id == channel.id,
-                    Message.telegram_message_id == message.id,
+        # Update job as failed
+        try:
+            await db.rollback()
+            await db.execute(
+                update(ScrapingJob)
+                .where(ScrapingJob.id == job_uuid)
+                .values(
+                    status="failed",
+                    error_message=str(e),
+                    completed_at=datetime.now(UTC),
+                    messages_processed=counts.messages_processed,
                 )
             )
-            if result.scalar_one_or_none():
-                continue  # Skip existing messages
-
-            media_type = get_media_type(message)
-
-            # Extract sender info
-            sender_id = None
-            first_name = None
-            last_name = None
-            username = None
-
-            if message.sender:
-                sender_id = message.sender.id
-                first_name = getattr(message.sender, "first_name", None)
-                last_name = getattr(message.sender, "last_name", None)
-                username = getattr(message.sender, "username", None)
-
-            # Extract reactions
-            reactions = None
-            if message.reactions:
-                reactions = {
-                    "results": [
-                        {
-                            "emoji": str(r.reaction),
-                            "count": r.count,
-                        }
-                        for r in message.reactions.results
-                    ]
-                }
-
-            msg_record = Message(
-                channel_id=channel.id,
-                telegram_message_id=message.id,
-                date=message.date.replace(tzinfo=UTC),
-                sender_id=sender_id,
-                first_name=first_name,
-                last_name=last_name,
-                username=username,
-                message_text=message.text or message.message,
-                media_type=media_type,
-                reply_to_message_id=message.reply_to_msg_id if message.reply_to else None,
-                post_author=message.post_author,
-                views=message.views,
-                forwards=message.forwards,
-                reactions=reactions,
-            )
-            batch.append(msg_record)
-
-            # Track media
-            if media_type and scrape_media and media_type not in ["webpage"]:
-                media_record = Media(
-                    channel_id=channel.id,
-                    telegram_message_id=message.id,
-                    media_type=media_type,
-                    download_status="pending",
-                )
-                db.add(media_record)
-                media_found += 1
+            await db.commit()
+        except Exception as db_error:
+            logger.error(f"Failed to update job status: {db_error}")
 
-            messages_processed += 1
+        return {
+            "job_id": job_id,
+            "status": "failed",
+            "error": str(e),
+            "messages_processed": counts.messages_processed,
+        }
 
-            # Batch insert
-            if len(batch) >= batch_size:
-                db.add_all(batch)
-                await db.commit()
-
-                # Check keyword alerts for each message in batch
-                for msg_record in batch:
-                    await check_keyword_alerts(
-                        db,
-                        uuid.UUID(user_id),
-                        channel.id,
-                        msg_record,
-                        msg_record.message_text,
-                    )
-                await db.commit()
+    finally:
+        await db.close()
 
-                batch = []
 
-                # Update progress
-                result = await db.execute(
-                    select(ScrapingJob).where(ScrapingJob.id == uuid.UUID(job_id))
-                )
-                job = result.scalar_one_or_none()
-                if job:
-                    job.messages_processed = messages_processed
-                    job.media_downloaded = media_found
-                    # Calculate progress percentage
-                    if total_messages_estimate > 0:
-                        progress = min(95, (messages_processed / total_messages_estimate) * 100)
-                        job.progress_percent = progress
-                    await db.commit()
+async def continuous_scrape(
+    job_id: str,
+    user_id: str,
+    channel_ids: list[str],
+    session_id: str,
+    progress: JobProgressBuffer,
+    redis: Redis,
+    interval_seconds: int = 60,
+    scrape_media: bool = True,
+) -> dict[str, Any]:
+    """
+    Scrape several channels for new messages every `interval_seconds` until cancelled.
 
-                logger.info(
-                    f"Processed {messages_processed} messages ({job.progress_percent:.1f}%)..."
+    Each round scrapes the channels concurrently (at most CONTINUOUS_SCRAPE_CONCURRENCY
+    at a time) over one shared Telegram client, each from its last scraped message
+    and with its own database session. A failing channel is logged and retried next
+    round. Job progress accumulates the totals of all channels.
+    """
+    job_uuid = uuid.UUID(job_id)
+    user_uuid = uuid.UUID(user_id)
+    session_uuid = uuid.UUID(session_id)
+    channel_uuids = [uuid.UUID(channel_id) for channel_id in channel_ids]
+
+    db = async_session_maker()
+    client: TelegramClient | None = None
+    counts = ScrapeCounts()
+    semaphore = asyncio.Semaphore(CONTINUOUS_SCRAPE_CONCURRENCY)
+    rounds = 0
+
+    async def scrape_one(channel_uuid: uuid.UUID) -> None:
+        async with semaphore, async_session_maker() as channel_db:
+            channel = await channel_db.get(Channel, channel_uuid)
+            if not channel:
+                raise ValueError(f"Channel {channel_uuid} not found")
+            from_message_id = await channel_db.scalar(
+                _LAST_SCRAPED_MESSAGE_ID, {"user_id": user_uuid, "channel_id": channel_uuid}
+            )
+            try:
+                await scrape_messages(
+                    channel_db,
+                    client,
+                    channel,
+                    session_uuid,
+                    user_uuid,
+                    job_uuid,
+                    counts,
+                    redis,
+                    from_message_id=from_message_id or 0,
+                    scrape_media=scrape_media,
                 )
+            except Exception as e:
+                forget_entity_on(e, session_id, channel.telegram_id)
+                raise
 
-        # Insert remaining batch
-        if batch:
-            db.add_all(batch)
-            await db.commit()
-
-            # Check keyword alerts for remaining messages
-            for msg_record in batch:
-                await check_keyword_alerts(
-                    db,
-                    uuid.UUID(user_id),
-                    channel.id,
-                    msg_record,
-                    msg_record.message_text,
-                )
-            await db.commit()
+    try:
+        claimed = await db.scalar(
+            update(ScrapingJob)
+            .where(ScrapingJob.id == job_uuid, ScrapingJob.status.in_(["pending", "running"]))
+            .values(status="running", started_at=datetime.now(UTC))
+            .returning(ScrapingJob.id)
+        )
+        await db.commit()
+        if claimed is None:
+            logger.info(
+                f"Continuous scrape job {job_id} was cancelled or already finished, skipping"
+            )
+            return {"job_id": job_id, "status": "skipped", "rounds": 0, "messages_processed": 0}
 
-        # Update user_channel with last scraped message
-        result = await db.execute(
-            select(UserChannel).where(
-                UserChannel.user_id == uuid.UUID(user_id),
-                UserChannel.channel_id == uuid.UUID(channel_id),
+        client = await get_telegram_client(db, session_uuid)
+        if not client:
+            raise ValueError("Could not create Telegram client")
+        # End the read transactions this session opens so its pooled connection isn't
+        # left idle in transaction between rounds (channels use their own sessions)
+        await db.rollback()
+
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            results = await asyncio.gather(
+                *(scrape_one(channel_uuid) for channel_uuid in channel_uuids),
+                return_exceptions=True,
             )
-        )
-        user_channel = result.scalar_one_or_none()
-        if user_channel and messages_processed > 0:
-            # Get the max message ID we scraped
-            result = await db.execute(
-                select(Message.telegram_message_id)
-                .where(Message.channel_id == channel.id)
-                .order_by(Message.telegram_message_id.desc())
-                .limit(1)
+            for channel_id, outcome in zip(channel_ids, results, strict=True):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Continuous scrape of channel {channel_id} failed: {outcome}")
+            rounds += 1
+
+            await progress.update(
+                job_uuid,
+                messages_processed=counts.messages_processed,
+                media_downloaded=counts.media_found,
             )
-            max_msg_id = result.scalar()
-            if max_msg_id:
-                user_channel.last_scraped_message_id = max_msg_id
-                await db.commit()
-
-        # Update job as completed
-        result = await db.execute(select(ScrapingJob).where(ScrapingJob.id == uuid.UUID(job_id)))
-        job = result.scalar_one_or_none()
-        if job and job.status != "cancelled":
-            job.status = "completed"
-            job.progress_percent = 100
-            job.messages_processed = messages_processed
-            job.media_downloaded = media_found
-            job.completed_at = datetime.now(UTC)
-            await db.commit()
 
-        logger.info(
-            f"Completed scraping job {job_id}: {messages_processed} messages, {media_found} media"
+            status = await db.scalar(_JOB_STATUS, {"job_id": job_uuid})
+            await db.rollback()
+            if status == "cancelled":
+                logger.info(f"Continuous job {job_id} was cancelled after {rounds} rounds")
+                break
+
+            await asyncio.sleep(max(0.0, interval_seconds - (loop.time() - started)))
+
+        await db.execute(
+            update(ScrapingJob)
+            .where(ScrapingJob.id == job_uuid)
+            .values(
+                messages_processed=counts.messages_processed,
+                media_downloaded=counts.media_found,
+                completed_at=datetime.now(UTC),
+            )
         )
+        await db.commit()
 
         return {
             "job_id": job_id,
-            "status": "completed",
-            "messages_processed": messages_processed,
-            "media_found": media_found,
+            "status": "cancelled",
+            "rounds": rounds,
+            "messages_processed": counts.messages_processed,
+            "media_found": counts.media_found,
         }
 
+    except asyncio.CancelledError:
+        # Stopped by the worker (job timeout or shutdown), not by the user
+        logger.warning(
+            f"Continuous scrape job {job_id} stopped by the worker after {rounds} rounds"
+        )
+
+        try:
+            await db.rollback()
+            await db.execute(
+                update(ScrapingJob)
+                .where(ScrapingJob.id == job_uuid, ScrapingJob.status == "running")
+                .values(
+                    status="failed",
+                    error_message="Stopped by the worker (job timeout or shutdown)",
+                    messages_processed=counts.messages_processed,
+                    media_downloaded=counts.media_found,
+                    completed_at=datetime.now(UTC),
+                )
+            )
+            await db.commit()
+        except Exception as db_error:
+            logger.error(f"Failed to update job status: {db_error}")
+        raise
+
     except Exception as e:
-        logger.error(f"Error in scrape job {job_id}: {e}")
+        logger.error(f"Error in continuous scrape job {job_id}: {e}")
 
-        # Update job as failed
         try:
-            result = await db.execute(
-                select(ScrapingJob).where(ScrapingJob.id == uuid.UUID(job_id))
+            await db.rollback()
+            await db.execute(
+                update(ScrapingJob)
+                .where(ScrapingJob.id == job_uuid)
+                .values(
+                    status="failed",
+                    error_message=str(e),
+                    completed_at=datetime.now(UTC),
+                    messages_processed=counts.messages_processed,
+                )
             )
-            job = result.scalar_one_or_none()
-            if job:
-                job.status = "failed"
-                job.error_message = str(e)
-                job.completed_at = datetime.now(UTC)
-                job.messages_processed = messages_processed
-                await db.commit()
+            await db.commit()
         except Exception as db_error:
             logger.error(f"Failed to update job status: {db_error}")
 
@@ -442,10 +759,9 @@ async def scrape_channel(
             "job_id": job_id,
             "status": "failed",
             "error": str(e),
-            "messages_processed": messages_processed,
+            "rounds": rounds,
+            "messages_processed": counts.messages_processed,
         }
 
     finally:
-        if client:
-            await client.disconnect()
         await db.close()
@@ -0,0 +1,98 @@
+"""Telegram state shared by the worker tasks of one process."""
+
+import asyncio
+import uuid
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from telethon import TelegramClient
+from telethon.errors import ChannelInvalidError, ChannelPrivateError
+from telethon.sessions import StringSession
+
+from telegram_scraper.models.telegram_session import TelegramSession
+from telegram_scraper.services.telegram_service import decrypt_session_string
+
+# Resolved channel entities per (session, channel telegram_id). Entities carry the
+# account-specific access hash, so they stay valid for every client of a session and
+# spare each task a get_dialogs() round trip.
+_entity_cache: dict[tuple[str, int], Any] = {}
+
+
+async def resolve_entity(
+    client: TelegramClient, session_id: uuid.UUID, telegram_id: int, username: str | None
+) -> Any:
+    """Get a channel's entity, from the cache when possible."""
+    key = (str(session_id), telegram_id)
+    entity = _entity_cache.get(key)
+    if entity is not None:
+        return entity
+
+    try:
+        entity = await client.get_entity(telegram_id)
+    except Exception:
+        if username:
+            entity = await client.get_entity(username)
+        else:
+            # Private channel without a username: only known via the dialog list
+            await client.get_dialogs()
+            try:
+                entity = await client.get_entity(telegram_id)
+            except Exception:
+                raise ValueError(f"Could not find channel {telegram_id}") from None
+
+    _entity_cache[key] = entity
+    return entity
+
+
+def forget_entity_on(error: BaseException, session_id: str, telegram_id: int | None) -> None:
+    """Drop a cached entity once Telegram reports the channel gone or inaccessible."""
+    if telegram_id is not None and isinstance(error, ChannelPrivateError | ChannelInvalidError):
+        _entity_cache.pop((session_id, telegram_id), None)
+
+
+# Connected clients shared by the worker's tasks, one per Telegram session, keyed with
+# the encrypted session string they were built from. Telethon clients serve
+# concurrent requests, while several connections on one auth key risk Telegram
+# revoking it, so tasks share a client instead of each connecting their own.
+_clients: dict[uuid.UUID, tuple[str, TelegramClient]] = {}
+_client_locks: defaultdict[uuid.UUID, asyncio.Lock] = defaultdict(asyncio.Lock)
+# Clients replaced after a re-authentication. Tasks may still be paging history or
+# downloading through them, so they stay connected until the worker shuts down.
+_retired_clients: set[TelegramClient] = set()
+
+
+async def get_telegram_client(db: AsyncSession, session_id: uuid.UUID) -> TelegramClient | None:
+    """Get a connected Telegram client for a session, reusing the worker's shared one."""
+    session = await db.get(TelegramSession, session_id)
+
+    if not session or not session.session_string:
+        return None
+
+    async with _client_locks[session_id]:
+        cached = _clients.pop(session_id, None)
+        if cached is not None:
+            session_string, client = cached
+            if session_string == session.session_string:
+                if not client.is_connected():
+                    await client.connect()
+                _clients[session_id] = cached
+                return client
+            # Session was re-authenticated since; stop handing out the stale client
+            # but leave it connected for tasks still using it
+            _retired_clients.add(client)
+
+        string_session = StringSession(decrypt_session_string(session.session_string))
+        client = TelegramClient(string_session, session.api_id, session.api_hash)
+        await client.connect()
+        _clients[session_id] = (session.session_string, client)
+        return client
+
+
+async def close_telegram_clients() -> None:
+    """Disconnect every shared client, including retired ones (worker shutdown)."""
+    while _clients:
+        _, (_, client) = _clients.popitem()
+        await client.disconnect()
+    while _retired_clients:
+        await _retired_clients.pop().disconnect()
@@ -3,16 +3,24 @@
 import logging
 from typing import Any
 
-from arq import cron
+from arq import cron, func
 from arq.connections import RedisSettings
 
 from telegram_scraper.config import settings
+from telegram_scraper.db import async_session_maker, engine
+from telegram_scraper.services.job_service import JobProgressBuffer
 from telegram_scraper.workers.tasks.download_media import (
     download_media_batch,
     download_single_media,
 )
 from telegram_scraper.workers.tasks.scheduler import check_scheduled_jobs
-from telegram_scraper.workers.tasks.scrape_channel import scrape_channel
+from telegram_scraper.workers.tasks.scrape_channel import continuous_scrape, scrape_channel
+from telegram_scraper.workers.telegram import close_telegram_clients
+
+try:
+    import uvloop
+except ImportError:  # optional "speedups" extra
+    uvloop = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,11 +29,16 @@ logger = logging.getLogger(__name__)
 async def startup(ctx: dict[str, Any]) -> None:
     """Worker startup hook."""
     logger.info("Worker starting up...")
+    ctx["job_progress"] = JobProgressBuffer(ctx["redis"], async_session_maker)
+    ctx["job_progress"].start()
 
 
 async def shutdown(ctx: dict[str, Any]) -> None:
     """Worker shutdown hook."""
     logger.info("Worker shutting down...")
+    await ctx["job_progress"].stop()
+    await close_telegram_clients()
+    await engine.dispose()
 
 
 async def scrape_channel_task(
@@ -45,6 +58,8 @@ async def scrape_channel_task(
         user_id=user_id,
         channel_id=channel_id,
         session_id=session_id,
+        progress=ctx["job_progress"],
+        redis=ctx["redis"],
         from_message_id=from_message_id,
         scrape_media=scrape_media,
     )
@@ -97,11 +112,17 @@ async def continuous_scrape_task(
     """Continuously scrape multiple channels."""
     logger.info(f"Starting continuous scrape job {job_id}")
 
-    # TODO: Implement continuous scraping
-    return {
-        "job_id": job_id,
-        "status": "stopped",
-    }
+    result = await continuous_scrape(
+        job_id=job_id,
+        user_id=user_id,
+        channel_ids=channel_ids,
+        session_id=session_id,
+        progress=ctx["job_progress"],
+        redis=ctx["redis"],
+        interval_seconds=interval_seconds,
+    )
+
+    return result
 
 
 class WorkerSettings:
@@ -113,16 +134,17 @@ class WorkerSettings:
         scrape_channel_task,
         download_media_task,
         download_media_batch_task,
-        continuous_scrape_task,
+        # Runs until cancelled, so it gets its own limit instead of job_timeout
+        func(continuous_scrape_task, timeout=settings.continuous_scrape_timeout),
         check_scheduled_jobs,
     ]
 
     on_startup = startup
     on_shutdown = shutdown
 
-    # Cron job to check for scheduled scrapes every minute
+    # Cron job to check for scheduled scrapes every minute (unset fields match any value)
     cron_jobs = [
-        cron(check_scheduled_jobs, minute=set(range(60))),  # Run every minute
+        cron(check_scheduled_jobs, second=0),
     ]
 
     max_jobs = 10
@@ -134,4 +156,7 @@ class WorkerSettings:
 if __name__ == "__main__":
     from arq.worker import run_worker
 
+    if uvloop is not None:
+        # libuv-based loop; Telethon and asyncpg only rely on the standard asyncio API
+        uvloop.install()
     run_worker(WorkerSettings)
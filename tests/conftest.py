@@ -1,6 +1,11 @@
 """Pytest configuration and fixtures."""
+import os
+
 import pytest
 
+# Fail tests on accidental relationship lazy loads (N+1 regressions)
+os.environ.setdefault("DB_RAISE_ON_LAZY_LOAD", "true")
+
 
 @pytest.fixture(scope="session")
 def anyio_backend():
@@ -0,0 +1,94 @@
+"""Response cache tests."""
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from telegram_scraper.core import cache
+from telegram_scraper.schemas.job import JobResponse
+
+
+class FakeRedis:
+    """In-memory stand-in for the string commands the cache uses."""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self.values[key] = value
+
+    async def incr(self, key: str) -> int:
+        value = int(self.values.get(key, b"0")) + 1
+        self.values[key] = str(value).encode()
+        return value
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+    redis = FakeRedis()
+    monkeypatch.setattr(cache, "get_redis", lambda: redis)
+    return redis
+
+
+def make_job() -> JobResponse:
+    return JobResponse(
+        id=uuid.uuid4(),
+        channel_id=uuid.uuid4(),
+        job_type="full",
+        status="completed",
+        progress_percent=100.0,
+        messages_processed=12,
+        media_downloaded=3,
+        error_message=None,
+        started_at=datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+        completed_at=datetime(2026, 1, 2, 3, 5, 0, tzinfo=UTC),
+        created_at=datetime(2026, 1, 2, 3, 4, 0, tzinfo=UTC),
+        job_metadata={"from_message_id": 0},
+    )
+
+
+async def test_cached_hit_matches_miss(fake_redis: FakeRedis):
+    """Test a cache hit serializes to the same response as the original miss."""
+    job = make_job()
+    calls = 0
+
+    @cache.cached("jobs", ttl=5)
+    async def get_jobs(db: object, user_id: uuid.UUID, limit: int = 50) -> dict:
+        nonlocal calls
+        calls += 1
+        return {
+            "jobs": [job],
+            "total": 1,
+            "limit": limit,
+            "next_cursor": {"after_created_at": job.created_at, "after_id": job.id},
+        }
+
+    user_id = uuid.uuid4()
+    miss = await get_jobs(None, user_id)
+    hit = await get_jobs(None, user_id)
+
+    assert calls == 1
+    assert hit == jsonable_encoder(miss)
+
+
+async def test_invalidate_drops_cached_entries(fake_redis: FakeRedis):
+    """Test invalidating a user's namespace makes the next read miss."""
+    calls = 0
+
+    @cache.cached("channels", ttl=10)
+    async def get_channels(db: object, user_id: uuid.UUID) -> list[dict]:
+        nonlocal calls
+        calls += 1
+        return [{"title": "news", "calls": calls}]
+
+    user_id = uuid.uuid4()
+    assert await get_channels(None, user_id) == [{"title": "news", "calls": 1}]
+    assert await get_channels(None, user_id) == [{"title": "news", "calls": 1}]
+
+    await cache.invalidate("channels", user_id)
+    assert await get_channels(None, user_id) == [{"title": "news", "calls": 2}]
@@ -0,0 +1,20 @@
+"""Media download helper tests."""
+
+from telegram_scraper.workers.tasks.download_media import _ext_from_filename
+
+
+def test_ext_from_filename():
+    """Test extensions follow PurePath.suffix for plain names."""
+    assert _ext_from_filename("clip.mp4") == ".mp4"
+    assert _ext_from_filename("archive.tar.gz") == ".gz"
+    assert _ext_from_filename(".bashrc") == ""
+    assert _ext_from_filename("README") == ""
+    assert _ext_from_filename("trailing.") == ""
+
+
+def test_ext_from_filename_ignores_directories():
+    """Test path separators in uploaded names never reach the extension."""
+    assert _ext_from_filename("dir.v2/file") == ""
+    assert _ext_from_filename("dir.v2\\file") == ""
+    assert _ext_from_filename("../../etc/passwd.txt") == ".txt"
+    assert _ext_from_filename("C:\\docs\\report.pdf") == ".pdf"
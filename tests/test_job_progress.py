@@ -0,0 +1,138 @@
+"""Job progress buffer tests."""
+
+import uuid
+
+from sqlalchemy.dialects import postgresql
+
+from telegram_scraper.services.job_service import JobProgressBuffer
+
+
+class FakePipeline:
+    """Transactional pipeline supporting the HGETALL + DELETE drain."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.ops: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def hgetall(self, key: str) -> None:
+        self.ops.append(("hgetall", key))
+
+    def delete(self, key: str) -> None:
+        self.ops.append(("delete", key))
+
+    async def execute(self) -> list:
+        results = []
+        for op, key in self.ops:
+            if op == "hgetall":
+                results.append(dict(self.redis.hashes.get(key, {})))
+            else:
+                results.append(int(self.redis.hashes.pop(key, None) is not None))
+        return results
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands the buffer uses."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    async def hset(self, key: str, field: str, value: bytes) -> None:
+        self.hashes.setdefault(key, {})[field.encode()] = value
+
+    async def hdel(self, key: str, field: str) -> None:
+        self.hashes.get(key, {}).pop(field.encode(), None)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakeSessionMaker:
+    """Session factory recording executed statements and commits."""
+
+    def __init__(self):
+        self.statements: list = []
+        self.commits = 0
+
+    def __call__(self) -> "FakeSessionMaker":
+        return self
+
+    async def __aenter__(self) -> "FakeSessionMaker":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, stmt, *args: object, **kwargs: object) -> None:
+        self.statements.append(stmt)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def compile_pg(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+async def test_flush_applies_latest_progress_in_one_update():
+    """Test buffered updates coalesce per job and flush as one multi-row UPDATE."""
+    redis, sessions = FakeRedis(), FakeSessionMaker()
+    buffer = JobProgressBuffer(redis, sessions)
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    await buffer.update(first, progress_percent=10.0, messages_processed=100, media_downloaded=1)
+    await buffer.update(first, progress_percent=20.0, messages_processed=200, media_downloaded=2)
+    await buffer.update(second, progress_percent=50.0, messages_processed=5, media_downloaded=0)
+
+    assert await buffer.flush() == 2
+    assert len(sessions.statements) == 1
+    assert sessions.commits == 1
+
+    compiled = compile_pg(sessions.statements[0])
+    params = list(compiled.params.values())
+    assert [first, 20.0, 200, 2] == params[params.index(first) : params.index(first) + 4]
+    assert [second, 50.0, 5, 0] == params[params.index(second) : params.index(second) + 4]
+    # A late flush never touches finished jobs
+    assert compiled.params["status_1"] == ["pending", "running"]
+
+    # The buffer was drained
+    assert await buffer.flush() == 0
+    assert len(sessions.statements) == 1
+
+
+async def test_flush_casts_all_null_columns():
+    """Test a column nobody reported stays NULL in VALUES and keeps the stored value."""
+    redis, sessions = FakeRedis(), FakeSessionMaker()
+    buffer = JobProgressBuffer(redis, sessions)
+
+    await buffer.update(uuid.uuid4(), messages_processed=42)
+    assert await buffer.flush() == 1
+
+    sql = str(compile_pg(sessions.statements[0]))
+    assert "coalesce(CAST(progress.progress_percent AS NUMERIC(5, 2))" in sql
+    assert "coalesce(CAST(progress.media_downloaded AS INTEGER)" in sql
+    assert "NULL" in sql.split("VALUES", 1)[1]
+
+
+async def test_terminal_status_bypasses_buffer():
+    """Test a terminal status is written at once and drops the job's buffered progress."""
+    redis, sessions = FakeRedis(), FakeSessionMaker()
+    buffer = JobProgressBuffer(redis, sessions)
+    job_id = uuid.uuid4()
+
+    await buffer.update(job_id, progress_percent=40.0, messages_processed=400)
+    await buffer.update(job_id, status="completed", progress_percent=100, messages_processed=1000)
+
+    assert len(sessions.statements) == 1
+    assert sessions.commits == 1
+    compiled = compile_pg(sessions.statements[0])
+    assert compiled.params["status"] == "completed"
+    assert compiled.params["messages_processed"] == 1000
+
+    assert await buffer.flush() == 0
+    assert len(sessions.statements) == 1
@@ -0,0 +1,103 @@
+"""Bulk message upsert tests."""
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from telegram_scraper.models.message import BULK_COLUMNS, COPY_THRESHOLD, Message
+
+
+class FakeResult:
+    """Result returning a fixed set of rows."""
+
+    def __init__(self, rows: list):
+        self.rows = rows
+
+    def all(self) -> list:
+        return self.rows
+
+
+class FakeSession:
+    """Session recording statements and COPY calls; RETURNING yields `returned`."""
+
+    def __init__(self, returned: list):
+        self.returned = returned
+        self.statements: list = []
+        self.copies: list[dict] = []
+
+    async def execute(self, stmt, *args: object, **kwargs: object) -> FakeResult:
+        self.statements.append(stmt)
+        return FakeResult(self.returned)
+
+    async def connection(self) -> "FakeSession":
+        return self
+
+    async def get_raw_connection(self) -> SimpleNamespace:
+        return SimpleNamespace(driver_connection=self)
+
+    async def copy_records_to_table(self, table: str, records: list, columns: tuple) -> None:
+        self.copies.append({"table": table, "records": records, "columns": columns})
+
+
+def make_rows(count: int, reactions: object = None) -> list[dict]:
+    channel_id = uuid.uuid4()
+    return [
+        {
+            "channel_id": channel_id,
+            "telegram_message_id": i,
+            "date": datetime(2026, 1, 1, tzinfo=UTC),
+            "message_text": f"message {i}",
+            "reactions": reactions,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+async def test_small_batch_uses_insert_on_conflict():
+    """Test a batch below the COPY threshold is one INSERT ... ON CONFLICT DO NOTHING."""
+    returned = [(uuid.uuid4(), 1)]
+    db = FakeSession(returned)
+
+    inserted = await Message.bulk_upsert(db, make_rows(3))
+
+    assert inserted == returned
+    assert len(db.statements) == 1
+    assert not db.copies
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (channel_id, telegram_message_id) DO NOTHING" in sql
+    assert "RETURNING messages.id, messages.telegram_message_id" in sql
+
+
+async def test_empty_batch_skips_the_database():
+    """Test an empty batch issues no statement."""
+    db = FakeSession([])
+    assert await Message.bulk_upsert(db, []) == []
+    assert not db.statements
+
+
+async def test_full_batch_copies_through_staging_table():
+    """Test a full batch is COPYed into a staging table and merged with ON CONFLICT."""
+    returned = [(uuid.uuid4(), 1), (uuid.uuid4(), 2)]
+    db = FakeSession(returned)
+    rows = make_rows(COPY_THRESHOLD, reactions={"results": [{"emoji": "x", "count": 2}]})
+    rows[1]["reactions"] = '{"results":[]}'  # pre-encoded by the scraper
+
+    inserted = await Message.bulk_upsert(db, rows)
+
+    assert inserted == returned
+    [copy] = db.copies
+    assert copy["table"] == "messages_staging"
+    assert copy["columns"] == BULK_COLUMNS
+    assert len(copy["records"]) == COPY_THRESHOLD
+
+    reactions = BULK_COLUMNS.index("reactions")
+    assert copy["records"][0][reactions] == '{"results":[{"emoji":"x","count":2}]}'
+    assert copy["records"][1][reactions] == '{"results":[]}'
+    assert copy["records"][0][BULK_COLUMNS.index("sender_id")] is None
+
+    statements = [str(stmt) for stmt in db.statements]
+    assert statements[0].startswith("CREATE TEMP TABLE messages_staging ON COMMIT DROP")
+    assert "ON CONFLICT (channel_id, telegram_message_id) DO NOTHING" in statements[1]
+    assert statements[2] == "DROP TABLE messages_staging"
@@ -0,0 +1,62 @@
+"""Stored message ID paging tests."""
+
+import uuid
+
+from telegram_scraper.services.message_service import StoredMessageIds
+
+
+class FakeResult:
+    """Scalars result holding a list of IDs."""
+
+    def __init__(self, ids: list[int]):
+        self.ids = ids
+
+    def all(self) -> list[int]:
+        return self.ids
+
+
+class FakeSessionMaker:
+    """Session factory serving keyset pages of stored IDs and recording each query."""
+
+    def __init__(self, stored: list[int], window: int):
+        self.stored = sorted(stored)
+        self.window = window
+        self.queries: list[int] = []
+
+    def __call__(self) -> "FakeSessionMaker":
+        return self
+
+    async def __aenter__(self) -> "FakeSessionMaker":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def scalars(self, stmt) -> FakeResult:
+        params = stmt.compile().params
+        after = next(v for k, v in params.items() if k.startswith("telegram_message_id"))
+        self.queries.append(after)
+        return FakeResult([i for i in self.stored if i > after][: self.window])
+
+
+async def test_pages_follow_the_scan():
+    """Test IDs are loaded one window at a time as the scan moves past each page."""
+    sessions = FakeSessionMaker([3, 5, 6, 9, 10, 11, 20, 40, 41], window=3)
+    stored_ids = StoredMessageIds(sessions, uuid.uuid4(), after_message_id=4, window=3)
+
+    found = [i for i in range(5, 50) if await stored_ids.contains(i)]
+
+    assert found == [5, 6, 9, 10, 11, 20, 40, 41]
+    assert sessions.queries == [4, 9, 20]
+    assert stored_ids.max_id == 41
+
+
+async def test_exhausted_pages_stop_querying():
+    """Test a short page ends loading and new IDs are never kept in memory."""
+    sessions = FakeSessionMaker([], window=3)
+    stored_ids = StoredMessageIds(sessions, uuid.uuid4(), window=3)
+
+    assert not any([await stored_ids.contains(i) for i in range(1, 1000)])
+    assert sessions.queries == [0]
+    assert stored_ids.max_id == 0
+    assert not stored_ids._ids
@@ -0,0 +1,42 @@
+"""Request schema validation tests."""
+
+import pytest
+from pydantic import ValidationError
+
+from telegram_scraper.schemas.auth import LoginRequest
+from telegram_scraper.schemas.user import UserCreate, UserUpdate
+
+
+@pytest.mark.parametrize(
+    "email",
+    ["user@example.com", "first.last+tag@sub.example.co", "o'brien@example.org"],
+)
+def test_valid_emails_accepted(email: str):
+    """Test well-formed addresses pass validation."""
+    assert UserCreate(email=email, password="password123").email == email
+
+
+@pytest.mark.parametrize(
+    "email",
+    [
+        "",
+        "plainaddress",
+        "@example.com",
+        "user@",
+        "user@localhost",
+        "a..b@example.com",
+        "user@-example.com",
+        "user name@example.com",
+        f"{'a' * 65}@example.com",
+    ],
+)
+def test_invalid_emails_rejected(email: str):
+    """Test malformed addresses are rejected."""
+    with pytest.raises(ValidationError):
+        LoginRequest(email=email, password="password123")
+
+
+def test_email_domain_normalized():
+    """Test the domain is lowercased and surrounding whitespace stripped."""
+    assert UserUpdate(email=" User@Example.COM ").email == "User@example.com"
+    assert UserUpdate().email is None
@@ -0,0 +1,34 @@
+"""Password hashing tests."""
+
+import bcrypt
+
+from telegram_scraper.core.security import (
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
+
+
+def test_argon2id_hash_roundtrip():
+    """Test new hashes are Argon2id and verify correctly."""
+    hashed = get_password_hash("correct horse")
+    assert hashed.startswith("$argon2id$")
+    assert verify_password("correct horse", hashed)
+    assert not verify_password("wrong horse", hashed)
+    assert not password_needs_rehash(hashed)
+
+
+def test_legacy_bcrypt_hash_still_verifies():
+    """Test bcrypt hashes from before the Argon2 switch are accepted and flagged."""
+    hashed = bcrypt.hashpw(b"legacy-password", bcrypt.gensalt(rounds=4)).decode()
+    assert verify_password("legacy-password", hashed)
+    assert not verify_password("other-password", hashed)
+    assert password_needs_rehash(hashed)
+
+
+def test_cached_verification_rejects_other_password():
+    """Test a cached successful verification doesn't accept a different password."""
+    hashed = get_password_hash("first-password")
+    assert verify_password("first-password", hashed)
+    assert verify_password("first-password", hashed)
+    assert not verify_password("second-password", hashed)
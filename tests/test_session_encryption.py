@@ -0,0 +1,20 @@
+"""Session string encryption tests."""
+
+from telegram_scraper.services.telegram_service import (
+    decrypt_session_string,
+    encrypt_many,
+    encrypt_session_string,
+)
+
+
+def test_session_string_roundtrip():
+    """Test an encrypted session string decrypts back to the original."""
+    token = encrypt_session_string("1BVtsOHsBu...")
+    assert token != "1BVtsOHsBu..."
+    assert decrypt_session_string(token) == "1BVtsOHsBu..."
+
+
+def test_encrypt_many_matches_single():
+    """Test bulk encryption yields tokens the single-value decrypt accepts."""
+    tokens = encrypt_many(["first", "second"])
+    assert [decrypt_session_string(token) for token in tokens] == ["first", "second"]